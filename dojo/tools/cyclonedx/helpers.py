@@ -1,23 +1,31 @@
 import logging
+from functools import lru_cache
 
 from cvss import CVSS3
 
 LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _parse_cvssv3(raw_vector):
+    # the same vectors are repeated a lot across the vulnerabilities and the
+    # affected components of a BOM, so parse each of them only once
+    if not raw_vector.startswith("CVSS:3"):
+        raw_vector = "CVSS:3.1/" + raw_vector
+    try:
+        return CVSS3(raw_vector)
+    except BaseException:
+        LOGGER.exception(
+            f"error while parsing vector CVSS v3 {raw_vector}",
+        )
+        return None
+
+
 class Cyclonedxhelper:
     def _get_cvssv3(self, raw_vector):
         if raw_vector is None or raw_vector == "":
             return None
-        if not raw_vector.startswith("CVSS:3"):
-            raw_vector = "CVSS:3.1/" + raw_vector
-        try:
-            return CVSS3(raw_vector)
-        except BaseException:
-            LOGGER.exception(
-                f"error while parsing vector CVSS v3 {raw_vector}",
-            )
-            return None
+        return _parse_cvssv3(raw_vector)
 
     def _get_component(self, components, reference):
         if reference not in components:
@@ -74,6 +74,7 @@ class CycloneDXJSONParser:
                 )
                 if report_date:
                     finding.date = report_date
+                # manage CVSS, the first valid CVSS v3 rating wins like in the XML parser
                 ratings = vulnerability.get("ratings", [])
                 for rating in ratings:
                     if (
@@ -89,6 +90,7 @@ class CycloneDXJSONParser:
                                 finding.severity = Cyclonedxhelper().fix_severity(severity)
                             else:
                                 finding.severity = cvssv3.severities()[0]
+                            break
                 vulnerability_ids = []
                 # set id as first vulnerability id
                 if vulnerability.get("id"):
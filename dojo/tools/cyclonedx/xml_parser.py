@@ -9,6 +9,9 @@ from dojo.tools.cyclonedx.helpers import Cyclonedxhelper
 
 LOGGER = logging.getLogger(__name__)
 
+_CVSS3_METHODS = frozenset({"CVSSv3", "CVSSv31"})
+_MITIGATED_STATES = frozenset({"resolved", "resolved_with_pedigree", "not_affected"})
+
 
 class CycloneDXXMLParser:
     def _get_findings_xml(self, file, test):
@@ -32,43 +35,67 @@ class CycloneDXXMLParser:
         if report_date_raw:
             report_date = dateutil.parser.parse(report_date_raw)
         bom_refs = {}
-        findings = []
-        for component in root.findall(
-            "b:components/b:component", namespaces=ns,
-        ):
-            component_name = component.findtext(f"{namespace}name")
-            component_version = component.findtext(f"{namespace}version")
-            # save a ref
-            if "bom-ref" in component.attrib:
-                bom_refs[component.attrib["bom-ref"]] = {
-                    "name": component_name,
-                    "version": component_version,
-                }
-            # for each vulnerabilities add a finding
-            for vulnerability in component.findall(
-                "v:vulnerabilities/v:vulnerability", namespaces=ns,
-            ):
-                finding_vuln = self.manage_vulnerability_legacy(
-                    vulnerability,
-                    ns,
-                    bom_refs,
-                    report_date=report_date,
-                    component_name=component_name,
-                    component_version=component_version,
+        # walk the top-level elements only once and dispatch on their tag
+        # instead of doing one full search per kind of node.
+        # vulnerabilities are only collected here so that all the bom-refs
+        # are known before any of them is converted into findings
+        components_tag = f"{namespace}components"
+        legacy_vulnerabilities_tag = "{" + ns["v"] + "}vulnerabilities"
+        vulnerabilities_tag = f"{namespace}vulnerabilities"
+        component_vulnerabilities = []
+        legacy_vulnerabilities = []
+        vulnerabilities = []
+        for element in root:
+            if element.tag == components_tag:
+                for component in element.findall("b:component", namespaces=ns):
+                    component_name = component.findtext(f"{namespace}name")
+                    component_version = component.findtext(f"{namespace}version")
+                    # save a ref
+                    if "bom-ref" in component.attrib:
+                        bom_refs[component.attrib["bom-ref"]] = {
+                            "name": component_name,
+                            "version": component_version,
+                        }
+                    component_vulnerabilities.extend(
+                        (vulnerability, component_name, component_version)
+                        for vulnerability in component.findall(
+                            "v:vulnerabilities/v:vulnerability", namespaces=ns,
+                        )
+                    )
+            elif element.tag == legacy_vulnerabilities_tag:
+                legacy_vulnerabilities.extend(
+                    element.findall("v:vulnerability", namespaces=ns),
                 )
-                findings.append(finding_vuln)
+            elif element.tag == vulnerabilities_tag:
+                vulnerabilities.extend(
+                    element.findall("b:vulnerability", namespaces=ns),
+                )
+        findings = []
+        # for each vulnerabilities of a component add a finding
+        for vulnerability, component_name, component_version in component_vulnerabilities:
+            finding_vuln = self.manage_vulnerability_legacy(
+                vulnerability,
+                ns,
+                report_date,
+                component_name,
+                component_version,
+            )
+            findings.append(finding_vuln)
         # manage adhoc vulnerabilities
-        for vulnerability in root.findall(
-            "v:vulnerabilities/v:vulnerability", namespaces=ns,
-        ):
+        for vulnerability in legacy_vulnerabilities:
+            component_name, component_version = Cyclonedxhelper()._get_component(
+                bom_refs, vulnerability.attrib["ref"],
+            )
             finding_vuln = self.manage_vulnerability_legacy(
-                vulnerability, ns, bom_refs, report_date,
+                vulnerability,
+                ns,
+                report_date,
+                component_name,
+                component_version,
             )
             findings.append(finding_vuln)
         # manage adhoc vulnerabilities (compatible with 1.4 of the spec)
-        for vulnerability in root.findall(
-            "b:vulnerabilities/b:vulnerability", namespaces=ns,
-        ):
+        for vulnerability in vulnerabilities:
             findings.extend(
                 self._manage_vulnerability_xml(
                     vulnerability, ns, bom_refs, report_date,
@@ -85,18 +112,20 @@ class CycloneDXXMLParser:
         self,
         vulnerability,
         ns,
-        bom_refs,
         report_date,
-        component_name=None,
-        component_version=None,
+        component_name,
+        component_version,
     ):
+        findtext = vulnerability.findtext
+        findall = vulnerability.findall
+        helper = Cyclonedxhelper()
         ref = vulnerability.attrib["ref"]
-        vuln_id = vulnerability.findtext("v:id", namespaces=ns)
+        vuln_id = findtext("v:id", namespaces=ns)
 
-        severity = vulnerability.findtext(
+        severity = findtext(
             "v:ratings/v:rating/v:severity", namespaces=ns,
         )
-        description = vulnerability.findtext("v:description", namespaces=ns)
+        description = findtext("v:description", namespaces=ns)
         # by the schema, only id and ref are mandatory, even the severity is
         # optional
         if not description:
@@ -107,14 +136,9 @@ class CycloneDXXMLParser:
                     f"**Severity:** {severity}",
                 ],
             )
-        if component_name is None:
-            bom = bom_refs[ref]
-            component_name = bom["name"]
-            component_version = bom["version"]
-
-        severity = Cyclonedxhelper().fix_severity(severity)
+        severity = helper.fix_severity(severity)
         references = ""
-        for adv in vulnerability.findall(
+        for adv in findall(
             "v:advisories/v:advisory", namespaces=ns,
         ):
             references += f"{adv.text}\n"
@@ -131,26 +155,28 @@ class CycloneDXXMLParser:
         if report_date:
             finding.date = report_date
         mitigation = ""
-        for recommend in vulnerability.findall(
+        for recommend in findall(
             "v:recommendations/v:recommendation", namespaces=ns,
         ):
             mitigation += f"{recommend.text}\n"
         if mitigation != "":
             finding.mitigation = mitigation
-        # manage CVSS
-        for rating in vulnerability.findall(
+        # manage CVSS, the first valid CVSS v3 rating wins
+        for rating in vulnerability.iterfind(
             "v:ratings/v:rating", namespaces=ns,
         ):
-            if rating.findtext("v:method", namespaces=ns) == "CVSSv3":
-                raw_vector = rating.findtext("v:vector", namespaces=ns)
-                severity = rating.findtext("v:severity", namespaces=ns)
-                cvssv3 = Cyclonedxhelper()._get_cvssv3(raw_vector)
+            rating_findtext = rating.findtext
+            if rating_findtext("v:method", namespaces=ns) == "CVSSv3":
+                raw_vector = rating_findtext("v:vector", namespaces=ns)
+                severity = rating_findtext("v:severity", namespaces=ns)
+                cvssv3 = helper._get_cvssv3(raw_vector)
                 if cvssv3:
                     finding.cvssv3 = cvssv3.clean_vector()
                     if severity:
-                        finding.severity = Cyclonedxhelper().fix_severity(severity)
+                        finding.severity = helper.fix_severity(severity)
                     else:
                         finding.severity = cvssv3.severities()[0]
+                    break
         # if there is some CWE
         cwes = self.get_cwes(vulnerability, "v", ns)
         if len(cwes) > 1:
@@ -182,20 +208,25 @@ class CycloneDXXMLParser:
         component_name=None,
         component_version=None,
     ):
-        vuln_id = vulnerability.findtext("b:id", namespaces=ns)
-        description = vulnerability.findtext("b:description", namespaces=ns)
-        detail = vulnerability.findtext("b:detail", namespaces=ns)
+        # bind the lookups used for each affected component to locals
+        findtext = vulnerability.findtext
+        findall = vulnerability.findall
+        helper = Cyclonedxhelper()
+        vuln_id = findtext("b:id", namespaces=ns)
+        description = findtext("b:description", namespaces=ns)
+        detail = findtext("b:detail", namespaces=ns)
         if detail:
             if description:
                 description += f"\n{detail}"
             else:
                 description = f"\n{detail}"
-        severity = vulnerability.findtext(
+        severity = findtext(
             "b:ratings/b:rating/b:severity", namespaces=ns,
         )
-        severity = Cyclonedxhelper().fix_severity(severity)
+        severity = helper.fix_severity(severity)
+        mitigation = findtext("b:recommendation", namespaces=ns)
         references = ""
-        for advisory in vulnerability.findall(
+        for advisory in findall(
             "b:advisories/b:advisory", namespaces=ns,
         ):
             title = advisory.findtext("b:title", namespaces=ns)
@@ -210,28 +241,70 @@ class CycloneDXXMLParser:
         if vuln_id:
             vulnerability_ids.append(vuln_id)
         # check references to see if we have other vulnerability ids
-        for reference in vulnerability.findall(
+        for reference in findall(
             "b:references/b:reference", namespaces=ns,
         ):
             vulnerability_id = reference.findtext("b:id", namespaces=ns)
             if vulnerability_id:
                 vulnerability_ids.append(vulnerability_id)
+        # the CVSS, the CWE and the analysis do not depend on the affected
+        # component, resolve them once for all the findings of the
+        # vulnerability. The first valid CVSS v3 rating wins
+        cvssv3_vector = None
+        for rating in vulnerability.iterfind(
+            "b:ratings/b:rating", namespaces=ns,
+        ):
+            rating_findtext = rating.findtext
+            method = rating_findtext("b:method", namespaces=ns)
+            if method in _CVSS3_METHODS:
+                raw_vector = rating_findtext("b:vector", namespaces=ns)
+                rating_severity = rating_findtext("b:severity", namespaces=ns)
+                cvssv3 = helper._get_cvssv3(raw_vector)
+                if cvssv3:
+                    cvssv3_vector = cvssv3.clean_vector()
+                    severity = helper.fix_severity(rating_severity) if rating_severity else cvssv3.severities()[0]
+                    break
+        # if there is some CWE. Check both for old namespace and for 1.4
+        cwes = self.get_cwes(vulnerability, "v", ns)
+        if not cwes:
+            cwes = self.get_cwes(vulnerability, "b", ns)
+        if len(cwes) > 1:
+            # TODO: support more than one CWE
+            LOGGER.debug(
+                f"more than one CWE for a finding {cwes}. NOT supported by parser API",
+            )
+        # Check for mitigation
+        is_mitigated = False
+        false_p = False
+        analysis = findall("b:analysis", namespaces=ns)
+        if analysis and len(analysis) == 1:
+            state = analysis[0].findtext("b:state", namespaces=ns)
+            if state:
+                if state in _MITIGATED_STATES:
+                    is_mitigated = True
+                elif state == "false_positive":
+                    false_p = True
+                if is_mitigated or false_p:
+                    detail = analysis[0].findtext(
+                        "b:detail", namespaces=ns,
+                    )
+                    if detail:
+                        mitigation += f"\n**This vulnerability is mitigated and/or suppressed:** {detail}\n"
         # for all component affected
+        title_suffix = f" | {vuln_id}"
         findings = []
-        for target in vulnerability.findall(
+        for target in findall(
             "b:affects/b:target", namespaces=ns,
         ):
             ref = target.find("b:ref", namespaces=ns)
-            component_name, component_version = Cyclonedxhelper()._get_component(
+            component_name, component_version = helper._get_component(
                 bom_refs, ref.text,
             )
             finding = Finding(
-                title=f"{component_name}:{component_version} | {vuln_id}",
+                title=f"{component_name}:{component_version}{title_suffix}",
                 description=description,
                 severity=severity,
-                mitigation=vulnerability.findtext(
-                    "b:recommendation", namespaces=ns,
-                ),
+                mitigation=mitigation,
                 references=references,
                 component_name=component_name,
                 component_version=component_version,
@@ -244,52 +317,15 @@ class CycloneDXXMLParser:
                 finding.unsaved_vulnerability_ids = vulnerability_ids
             if report_date:
                 finding.date = report_date
-            # manage CVSS
-            for rating in vulnerability.findall(
-                "b:ratings/b:rating", namespaces=ns,
-            ):
-                method = rating.findtext("b:method", namespaces=ns)
-                if method == "CVSSv3" or method == "CVSSv31":
-                    raw_vector = rating.findtext("b:vector", namespaces=ns)
-                    severity = rating.findtext("b:severity", namespaces=ns)
-                    cvssv3 = Cyclonedxhelper()._get_cvssv3(raw_vector)
-                    if cvssv3:
-                        finding.cvssv3 = cvssv3.clean_vector()
-                        if severity:
-                            finding.severity = Cyclonedxhelper().fix_severity(severity)
-                        else:
-                            finding.severity = cvssv3.severities()[0]
-            # if there is some CWE. Check both for old namespace and for 1.4
-            cwes = self.get_cwes(vulnerability, "v", ns)
-            if not cwes:
-                cwes = self.get_cwes(vulnerability, "b", ns)
-            if len(cwes) > 1:
-                # TODO: support more than one CWE
-                LOGGER.debug(
-                    f"more than one CWE for a finding {cwes}. NOT supported by parser API",
-                )
+            if cvssv3_vector:
+                finding.cvssv3 = cvssv3_vector
             if len(cwes) > 0:
                 finding.cwe = cwes[0]
-            # Check for mitigation
-            analysis = vulnerability.findall("b:analysis", namespaces=ns)
-            if analysis and len(analysis) == 1:
-                state = analysis[0].findtext("b:state", namespaces=ns)
-                if state:
-                    if (
-                        state == "resolved"
-                        or state == "resolved_with_pedigree"
-                        or state == "not_affected"
-                    ):
-                        finding.is_mitigated = True
-                        finding.active = False
-                    elif state == "false_positive":
-                        finding.false_p = True
-                        finding.active = False
-                    if not finding.active:
-                        detail = analysis[0].findtext(
-                            "b:detail", namespaces=ns,
-                        )
-                        if detail:
-                            finding.mitigation += f"\n**This vulnerability is mitigated and/or suppressed:** {detail}\n"
+            if is_mitigated:
+                finding.is_mitigated = True
+                finding.active = False
+            elif false_p:
+                finding.false_p = True
+                finding.active = False
             findings.append(finding)
         return findings
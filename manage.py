@@ -3,6 +3,13 @@ import os
 import sys
 
 if __name__ == "__main__":
+    # answer version queries without loading the settings and all the apps
+    if sys.argv[1:] in (["--version"], ["version"]):
+        import django
+
+        sys.stdout.write(django.get_version() + "\n")
+        sys.exit(0)
+
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "dojo.settings.settings")
 
     from django.core.management import execute_from_command_line
@@ -2,10 +2,12 @@ import logging
 import os
 import re
 import unittest
+from contextlib import contextmanager
 from pathlib import Path
 
+import requests
 from selenium import webdriver
-from selenium.common.exceptions import NoAlertPresentException, NoSuchElementException
+from selenium.common.exceptions import NoAlertPresentException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions
@@ -15,8 +17,19 @@ from selenium.webdriver.support.ui import WebDriverWait
 logger = logging.getLogger(__name__)
 
 
+# seconds find_element(s) keep polling for an element that is not (yet) there
+dd_implicit_wait = 1
 dd_driver = None
 dd_driver_options = None
+# user the shared browser session is currently logged in as
+dd_logged_in_user = None
+
+# Images are now working after https://github.com/DefectDojo/django-DefectDojo/pull/3954,
+# but http://localhost:8080/static/dojo/img/zoom-in.cur still produces a 404
+#
+# The addition of the trigger exception is due to the Report Builder tests.
+# The addition of the innerHTML exception is due to the test for quick reports in finding_test.py
+accepted_javascript_messages = re.compile(r"(zoom\-in\.cur.*)404\ \(Not\ Found\)|Uncaught TypeError: Cannot read properties of null \(reading \'trigger\'\)|Uncaught TypeError: Cannot read properties of null \(reading \'innerHTML\'\)")
 
 
 def on_exception_html_source_logger(func):
@@ -26,9 +39,9 @@ def on_exception_html_source_logger(func):
 
         except Exception:
             logger.info(f"exception occured at url: {self.driver.current_url}")
-            logger.info(f"page source: {self.driver.page_source}")
-            f = Path("selenium_page_source.html").open("w", encoding="utf-8")
-            f.writelines(self.driver.page_source)
+            page_source = self.driver.page_source
+            logger.info(f"page source: {page_source}")
+            Path("selenium_page_source.html").write_text(page_source, encoding="utf-8")
             # time.sleep(30)
             raise
 
@@ -36,18 +49,7 @@ def on_exception_html_source_logger(func):
 
 
 def set_suite_settings(suite, *, jira=False, github=False, block_execution=False):
-    if jira:
-        suite.addTest(BaseTestCase("enable_jira"))
-    else:
-        suite.addTest(BaseTestCase("disable_jira"))
-    if github:
-        suite.addTest(BaseTestCase("enable_github"))
-    else:
-        suite.addTest(BaseTestCase("disable_github"))
-    if block_execution:
-        suite.addTest(BaseTestCase("enable_block_execution"))
-    else:
-        suite.addTest(BaseTestCase("disable_block_execution"))
+    suite.addTest(SuiteSettingsTestCase(jira=jira, github=github, block_execution=block_execution))
 
 
 class BaseTestCase(unittest.TestCase):
@@ -76,15 +78,41 @@ class BaseTestCase(unittest.TestCase):
                 "--disable-gpu",
             )  # on windows sometimes chrome can't start with certain gpu driver versions, even in headless mode
 
+            # skip the background work a regular browser profile does (updates, sync, safe browsing, crash reporting, ...)
+            # which slows down the browser start and adds network traffic to every test
+            for argument in (
+                "--disable-extensions",
+                "--disable-background-networking",
+                "--disable-background-timer-throttling",
+                "--disable-renderer-backgrounding",
+                "--disable-breakpad",
+                "--disable-component-update",
+                "--disable-client-side-phishing-detection",
+                "--disable-sync",
+                "--disable-translate",
+                "--metrics-recording-only",
+                "--mute-audio",
+                "--no-default-browser-check",
+                "--no-first-run",
+            ):
+                dd_driver_options.add_argument(argument)
+
             # start maximized or at least with sufficient with because datatables will hide certain controls when the screen is too narrow
             dd_driver_options.add_argument("--window-size=1280,1024")
             # dd_driver_options.add_argument("--start-maximized")
 
             dd_driver_options.set_capability(name="acceptInsecureCerts", value=True)
 
+            # keep the http cache on disk so static assets (datatables, bootstrap, fonts, ...) are reused by the
+            # next browser started with the same directory. Only the cache is shared, not cookies or sessions.
+            # this is meant for local runs: CI starts every test file in a fresh container, so nothing would be reused there
+            if chrome_cache_dir := os.environ.get("DD_CHROME_CACHE_DIR"):
+                dd_driver_options.add_argument(f"--disk-cache-dir={chrome_cache_dir}")
+
             # some extra logging can be turned on if you want to query the browser javascripe console in your tests
             desired = webdriver.DesiredCapabilities.CHROME
-            desired["goog:loggingPrefs"] = {"browser": "ALL"}
+            # only errors are checked by assertNoConsoleErrors
+            desired["goog:loggingPrefs"] = {"browser": "SEVERE"}
 
             # set automatic downloads to test csv and excel export
             prefs = {"download.default_directory": cls.export_path}
@@ -108,7 +136,7 @@ class BaseTestCase(unittest.TestCase):
                 desired_capabilities=desired,
             )
             # best practice is only use explicit waits
-            dd_driver.implicitly_wait(1)
+            dd_driver.implicitly_wait(dd_implicit_wait)
 
         cls.driver = dd_driver
         cls.base_url = os.environ["DD_BASE_URL"]
@@ -117,49 +145,85 @@ class BaseTestCase(unittest.TestCase):
         self.verificationErrors = []
         self.accept_next_alert = True
         self.accept_javascript_errors = False
-        self.driver.execute_script("console.clear()")
-        # clear browser console logs?
 
     def login_page(self):
-        driver = self.driver
-        driver.get(self.base_url + "login")
-        driver.find_element(By.ID, "id_username").clear()
-        driver.find_element(By.ID, "id_username").send_keys(os.environ["DD_ADMIN_USER"])
-        driver.find_element(By.ID, "id_password").clear()
-        driver.find_element(By.ID, "id_password").send_keys(
-            os.environ["DD_ADMIN_PASSWORD"],
-        )
-        driver.find_element(By.CSS_SELECTOR, "button.btn.btn-success").click()
-
-        self.assertFalse(
-            self.is_element_by_css_selector_present(
-                ".alert-danger", "Please enter a correct username and password",
-            ),
-        )
-        return driver
+        return self.login_as(os.environ["DD_ADMIN_USER"], os.environ["DD_ADMIN_PASSWORD"])
 
     def login_standard_page(self):
+        return self.login_as("propersahm", "Def3ctD0jo&")
+
+    def login_as(self, username, password, *, use_form=False):
+        global dd_logged_in_user
         driver = self.driver
-        driver.get(self.base_url + "login")
-        driver.find_element(By.ID, "id_username").clear()
-        driver.find_element(By.ID, "id_username").send_keys("propersahm")
-        driver.find_element(By.ID, "id_password").clear()
-        driver.find_element(By.ID, "id_password").send_keys("Def3ctD0jo&")
-        driver.find_element(By.CSS_SELECTOR, "button.btn.btn-success").click()
-
-        self.assertFalse(
-            self.is_element_by_css_selector_present(
-                ".alert-danger", "Please enter a correct username and password",
-            ),
-        )
+        if dd_logged_in_user == username and not use_form:
+            # the browser session is shared by all tests, so if we are still logged in as this user
+            # only load the landing page. Fall back to the login form if the session is gone.
+            driver.get(self.base_url)
+            if not driver.current_url.startswith(self.base_url + "login"):
+                return driver
+
+        dd_logged_in_user = None
+        if use_form or not self.login_with_session_cookie(username, password):
+            driver.get(self.base_url + "login")
+            self.clear_and_send_keys(By.ID, "id_username", username)
+            self.clear_and_send_keys(By.ID, "id_password", password)
+            driver.find_element(By.CSS_SELECTOR, "button.btn.btn-success").click()
+
+            self.assertFalse(
+                self.is_element_by_css_selector_present(
+                    ".alert-danger", "Please enter a correct username and password",
+                ),
+            )
+        dd_logged_in_user = username
         return driver
 
+    def login_with_session_cookie(self, username, password):
+        # log in with a plain http client and hand the session cookie over to the browser, so the browser only has to
+        # load the landing page instead of rendering the login form and following the redirects of the login post.
+        # returns False if that didn't work out, the caller then has to use the login form.
+        login_url = self.base_url + "login"
+        with requests.Session() as session:
+            session.get(login_url, timeout=30)
+            csrf_token = session.cookies.get("csrftoken")
+            if not csrf_token:
+                return False
+            response = session.post(
+                login_url,
+                data={"username": username, "password": password, "csrfmiddlewaretoken": csrf_token},
+                headers={"Referer": login_url},
+                allow_redirects=False,
+                timeout=30,
+            )
+            session_id = session.cookies.get("sessionid")
+        if response.status_code != 302 or not session_id:
+            return False
+
+        driver = self.driver
+        # cookies can only be set for the site the browser is on, nginx_health is the cheapest page to get there
+        if not driver.current_url.startswith(self.base_url):
+            driver.get(self.base_url + "nginx_health")
+        driver.delete_cookie("sessionid")
+        driver.add_cookie({"name": "sessionid", "value": session_id, "path": "/", "httpOnly": True})
+        driver.get(self.base_url)
+        return not driver.current_url.startswith(login_url)
+
+    def clear_and_send_keys(self, by, value, keys):
+        # look the field up once for both commands
+        field = self.driver.find_element(by, value)
+        field.clear()
+        field.send_keys(keys)
+        return field
+
     def test_login(self):
-        return self.login_page()
+        # every suite starts with this test, so it always goes through the login form to keep the form covered.
+        # the logins tests do as part of their setup can take the session cookie shortcut
+        return self.login_as(os.environ["DD_ADMIN_USER"], os.environ["DD_ADMIN_PASSWORD"], use_form=True)
 
     def logout(self):
+        global dd_logged_in_user
         driver = self.driver
         driver.get(self.base_url + "logout")
+        dd_logged_in_user = None
 
         self.assertTrue(self.is_text_present_on_page("Login"))
         return driver
@@ -169,34 +233,68 @@ class BaseTestCase(unittest.TestCase):
 
     @on_exception_html_source_logger
     def delete_product_if_exists(self, name="QA Test"):
+        # ask the api first, so the product overview is only rendered when there is something to delete
+        if self.count_via_api("products", name_exact=name) == 0:
+            return
+
         driver = self.driver
         # Navigate to the product page
         self.goto_product_overview(driver)
         # Select the specific product to delete
-        qa_products = driver.find_elements(By.LINK_TEXT, name)
+        with self.without_implicit_wait():
+            qa_products = driver.find_elements(By.LINK_TEXT, name)
 
         if len(qa_products) > 0:
             self.test_delete_product(name)
 
     @on_exception_html_source_logger
     def delete_finding_template_if_exists(self, name="App Vulnerable to XSS"):
+        # ask the api first, so the template page is only rendered when there is something to delete
+        if self.count_via_api("finding_templates", title=name) == 0:
+            return
+
         driver = self.driver
 
         driver.get(self.base_url + "template")
         # Click on `Delete Template` button
-        templates = driver.find_elements(By.LINK_TEXT, name)
+        with self.without_implicit_wait():
+            templates = driver.find_elements(By.LINK_TEXT, name)
         if len(templates) > 0:
             driver.find_element(By.ID, "id_delete").click()
             # Click 'Yes' on Alert popup
             driver.switch_to.alert.accept()
 
-    # used to load some page just to get started
-    # we choose /user because it's lightweight and fast
-    def goto_some_page(self):
+    def count_via_api(self, endpoint, **params):
+        # count the objects matching the filter params with a single api call made by the browser, using its session.
+        # returns None if the api couldn't be asked, e.g. when the browser isn't on the site yet
+        return self.driver.execute_script(
+            """
+            return fetch(arguments[0] + "?" + new URLSearchParams(arguments[1]), {headers: {Accept: "application/json"}})
+                .then(response => response.ok ? response.json() : null)
+                .then(data => data ? data.count : null)
+                .catch(() => null);
+            """,
+            self.base_url + "api/v2/" + endpoint + "/",
+            params,
+        )
+
+    def goto_page_once(self, rel_url):
+        # only load the page when the browser is not already showing it. Only use this for pages that render the
+        # current state after being posted to, like the settings pages, as the page isn't reloaded.
         driver = self.driver
-        driver.get(self.base_url + "user")
+        url = self.base_url + rel_url
+        if driver.current_url.rstrip("/") != url.rstrip("/"):
+            driver.get(url)
         return driver
 
+    # used to load some page just to get started, any page with the regular layout (menu, search box) will do.
+    # a page the browser is already showing is reused, otherwise we choose /user because it's lightweight and fast
+    def goto_some_page(self):
+        driver = self.driver
+        if driver.current_url.startswith(self.base_url) and self.is_element_by_id_present("simple_search"):
+            return driver
+        return self.goto_page_once("user")
+
     def goto_product_overview(self, driver):
         driver.get(self.base_url + "product")
         self.wait_for_datatable_if_content("no_products", "products_wrapper")
@@ -234,9 +332,12 @@ class BaseTestCase(unittest.TestCase):
     def wait_for_datatable_if_content(self, no_content_id, wrapper_id):
         if not self.is_element_by_id_present(no_content_id):
             # wait for product_wrapper div as datatables javascript modifies the DOM on page load.
-            WebDriverWait(self.driver, 30).until(
-                expected_conditions.presence_of_element_located((By.ID, wrapper_id)),
-            )
+            # the wrapper usually shows up within a few hundred milliseconds, so poll often. Every poll is a single
+            # lookup, without the implicit wait the polling interval would otherwise be stretched to.
+            with self.without_implicit_wait():
+                WebDriverWait(self.driver, 30, poll_frequency=0.05).until(
+                    expected_conditions.presence_of_element_located((By.ID, wrapper_id)),
+                )
 
     def is_element_by_css_selector_present(self, selector, text=None):
         elems = self.driver.find_elements(By.CSS_SELECTOR, selector)
@@ -253,12 +354,20 @@ class BaseTestCase(unittest.TestCase):
 
         return False
 
-    def is_element_by_id_present(self, elem_id):
+    @contextmanager
+    def without_implicit_wait(self):
+        # the implicit wait also applies to lookups that find nothing, so checking that something is not on an
+        # already loaded page would otherwise always take the full implicit wait
+        self.driver.implicitly_wait(0)
         try:
-            self.driver.find_element(By.ID, elem_id)
-        except NoSuchElementException:
-            return False
-        return True
+            yield
+        finally:
+            self.driver.implicitly_wait(dd_implicit_wait)
+
+    def is_element_by_id_present(self, elem_id):
+        with self.without_implicit_wait():
+            elems = self.driver.find_elements(By.ID, elem_id)
+        return len(elems) > 0
 
     def is_info_message_present(self, text=None):
         return self.is_element_by_css_selector_present(".alert-info", text=text)
@@ -280,33 +389,44 @@ class BaseTestCase(unittest.TestCase):
         # if len(elems) == 0:
         #     logger.debug("couldn't find: ", text, "path: ", path)
 
-        body = self.driver.find_element(By.TAG_NAME, "body")
-        return re.search(text, body.text)
+        # search the visible text in the browser instead of transferring the whole body text.
+        # this is a plain substring search, text is not a regular expression
+        return self.driver.execute_script("return document.body.innerText.includes(arguments[0]);", text)
 
-    def element_exists_by_id(self, elem_id):
-        elems = self.driver.find_elements(By.ID, elem_id)
-        return len(elems) > 0
+    def get_checked_states(self, checkbox_ids):
+        # read all checkboxes with a single script instead of one find_element and is_selected per checkbox
+        checkbox_ids = list(checkbox_ids)
+        states = self.driver.execute_script(
+            "return arguments[0].map(id => document.getElementById(id).checked);", checkbox_ids,
+        )
+        return dict(zip(checkbox_ids, states, strict=True))
 
     def change_system_setting(self, setting_id, *, enable=True):
-        logger.info("changing system setting " + setting_id + " enable: " + str(enable))
-        driver = self.driver
-        driver.get(self.base_url + "system_settings")
-
-        is_enabled = driver.find_element(By.ID, setting_id).is_selected()
-        if (enable and not is_enabled) or (not enable and is_enabled):
-            # driver.find_element(By.XPATH, '//*[@id=' + setting_id + ']').click()
-            driver.find_element(By.ID, setting_id).click()
+        return self.change_system_settings({setting_id: enable})[setting_id]
+
+    def change_system_settings(self, settings):
+        # settings maps the ids of system settings checkboxes to whether they should be enabled,
+        # all of them are changed with a single save
+        logger.info(f"changing system settings: {settings}")
+        driver = self.goto_page_once("system_settings")
+
+        is_enabled = self.get_checked_states(settings)
+        # nothing to save and nothing to re-check if the settings already have the wanted values
+        if is_enabled != settings:
+            for setting_id, enable in settings.items():
+                if is_enabled[setting_id] != enable:
+                    driver.find_element(By.ID, setting_id).click()
             # save settings
             driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
-            # check if it's enabled after reload
+            # check if they are enabled after reload
+            is_enabled = self.get_checked_states(settings)
 
-        is_enabled = driver.find_element(By.ID, setting_id).is_selected()
+        for setting_id, enable in settings.items():
+            if enable:
+                self.assertTrue(is_enabled[setting_id])
 
-        if enable:
-            self.assertTrue(is_enabled)
-
-        if not enable:
-            self.assertFalse(is_enabled)
+            if not enable:
+                self.assertFalse(is_enabled[setting_id])
 
         return is_enabled
 
@@ -332,10 +452,9 @@ class BaseTestCase(unittest.TestCase):
         # we set the admin user (ourselves) to have block_execution checked
         # this will force dedupe to happen synchronously, among other things like notifications, rules, ...
         logger.info(f"setting block execution to: {block_execution}")
-        driver = self.driver
-        driver.get(self.base_url + "profile")
+        driver = self.goto_page_once("profile")
         if (
-            driver.find_element(By.ID, "id_block_execution").is_selected()
+            self.get_checked_states(["id_block_execution"])["id_block_execution"]
             != block_execution
         ):
             driver.find_element(By.XPATH, '//*[@id="id_block_execution"]').click()
@@ -343,7 +462,7 @@ class BaseTestCase(unittest.TestCase):
             driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
             # check if it's enabled after reload
             self.assertEqual(
-                driver.find_element(By.ID, "id_block_execution").is_selected(),
+                self.get_checked_states(["id_block_execution"])["id_block_execution"],
                 block_execution,
             )
         return driver
@@ -399,17 +518,16 @@ class BaseTestCase(unittest.TestCase):
         {'level': 'WARNING', 'message': 'http://localhost:8080/product/type/4/edit 562:16 "warning"', 'source': 'console-api', 'timestamp': 1583952828410}
         {'level': 'SEVERE', 'message': 'http://localhost:8080/product/type/4/edit 563:16 "error"', 'source': 'console-api', 'timestamp': 1583952828410}
         """
-        for entry in WebdriverOnlyNewLogFacade(self.driver).get_log("browser"):
-            """
-            Images are now working after https://github.com/DefectDojo/django-DefectDojo/pull/3954,
-            but http://localhost:8080/static/dojo/img/zoom-in.cur still produces a 404
-
-            The addition of the trigger exception is due to the Report Builder tests.
-            The addition of the innerHTML exception is due to the test for quick reports in finding_test.py
-            """
-            accepted_javascript_messages = r"(zoom\-in\.cur.*)404\ \(Not\ Found\)|Uncaught TypeError: Cannot read properties of null \(reading \'trigger\'\)|Uncaught TypeError: Cannot read properties of null \(reading \'innerHTML\'\)"
-
+        current_url = None
+        # chromedriver clears its log buffer when it is read, so these are only the entries logged since the last check
+        for entry in self.driver.get_log("browser"):
             if entry["level"] == "SEVERE":
+                if accepted_javascript_messages.search(entry["message"]):
+                    logger.warning(
+                        "skipping javascript errors related to known issues images, see https://github.com/DefectDojo/django-DefectDojo/blob/master/tests/base_test_class.py#L324",
+                    )
+                    continue
+
                 # TODO: actually this seems to be the previous url
                 # self.driver.save_screenshot("C:\\Data\\django-DefectDojo\\tests\\javascript-errors.png")
                 # with open("C:\\Data\\django-DefectDojo\\tests\\javascript-errors.html", "w") as f:
@@ -419,18 +537,17 @@ class BaseTestCase(unittest.TestCase):
                 logger.info(
                     "There was a SEVERE javascript error in the console, please check all steps fromt the current test to see where it happens",
                 )
+                # only ask the browser for its url once, and only when there is something to report
+                if current_url is None:
+                    current_url = self.driver.current_url
                 logger.info(
                     "Currently there is no reliable way to find out at which url the error happened, but it could be: ."
-                    + self.driver.current_url,
+                    + current_url,
                 )
                 if self.accept_javascript_errors:
                     logger.warning(
                         "skipping SEVERE javascript error because accept_javascript_errors is True!",
                     )
-                elif re.search(accepted_javascript_messages, entry["message"]):
-                    logger.warning(
-                        "skipping javascript errors related to known issues images, see https://github.com/DefectDojo/django-DefectDojo/blob/master/tests/base_test_class.py#L324",
-                    )
                 else:
                     self.assertNotEqual(entry["level"], "SEVERE")
 
@@ -453,29 +570,19 @@ class BaseTestCase(unittest.TestCase):
                 dd_driver.quit()
 
 
-class WebdriverOnlyNewLogFacade:
-
-    last_timestamp = 0
-
-    def __init__(self, webdriver):
-        self._webdriver = webdriver
-
-    def get_log(self, log_type):
-        last_timestamp = self.last_timestamp
-        entries = self._webdriver.get_log(log_type)
-        filtered = []
-
-        for entry in entries:
-            # check the logged timestamp against the
-            # stored timestamp
-            if entry["timestamp"] > self.last_timestamp:
-                filtered.append(entry)
+class SuiteSettingsTestCase(BaseTestCase):
 
-                # save the last timestamp only if newer
-                # in this set of logs
-                last_timestamp = max(last_timestamp, entry["timestamp"])
+    """Applies the jira, github and block execution settings a suite runs with, see set_suite_settings"""
 
-        # store the very last timestamp
-        self.last_timestamp = last_timestamp
+    def __init__(self, method_name="apply_suite_settings", *, jira=False, github=False, block_execution=False):
+        super().__init__(method_name)
+        self.jira = jira
+        self.github = github
+        self.block_execution = block_execution
 
-        return filtered
+    def apply_suite_settings(self):
+        self.change_system_settings({
+            "id_enable_jira": self.jira,
+            "id_enable_github": self.github,
+        })
+        self.set_block_execution(block_execution=self.block_execution)
@@ -29,7 +29,7 @@ class CloseOldTest(BaseTestCase):
         driver = self.driver
         driver.get(self.base_url + "finding?page=1")
 
-        if self.element_exists_by_id("no_findings"):
+        if self.is_element_by_id_present("no_findings"):
             text = driver.find_element(By.ID, "no_findings").text
             if "No findings found." in text:
                 return
@@ -245,19 +245,6 @@ def add_close_old_tests_to_suite(suite, *, jira=False, github=False, block_execu
     suite.addTest(BaseTestCase("test_login"))
     set_suite_settings(suite, jira=jira, github=github, block_execution=block_execution)
 
-    if jira:
-        suite.addTest(BaseTestCase("enable_jira"))
-    else:
-        suite.addTest(BaseTestCase("disable_jira"))
-    if github:
-        suite.addTest(BaseTestCase("enable_github"))
-    else:
-        suite.addTest(BaseTestCase("disable_github"))
-    if block_execution:
-        suite.addTest(BaseTestCase("enable_block_execution"))
-    else:
-        suite.addTest(BaseTestCase("disable_block_execution"))
-
     suite.addTest(ProductTest("test_create_product"))
     # Test same scanners - same engagement - dynamic - dedupe
     suite.addTest(CloseOldTest("test_delete_findings"))
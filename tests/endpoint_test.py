@@ -21,8 +21,7 @@ class EndpointTest(BaseTestCase):
         driver.find_element(By.LINK_TEXT, "New Endpoint").click()
         # Keep a good practice of clearing field before entering value
         # Endpoints
-        driver.find_element(By.ID, "id_endpoint").clear()
-        driver.find_element(By.ID, "id_endpoint").send_keys("moving.com.rnd")
+        self.clear_and_send_keys(By.ID, "id_endpoint", "moving.com.rnd")
         # Select product to assign endpoint to
         Select(driver.find_element(By.ID, "id_product")).select_by_visible_text("QA Test")
         # submit
@@ -38,8 +37,7 @@ class EndpointTest(BaseTestCase):
         driver.find_element(By.LINK_TEXT, "New Endpoint").click()
         # Keep a good practice of clearing field before entering value
         # Endpoints
-        driver.find_element(By.ID, "id_endpoint").clear()
-        driver.find_element(By.ID, "id_endpoint").send_keys("https://example.com:1")
+        self.clear_and_send_keys(By.ID, "id_endpoint", "https://example.com:1")
         # Select product to assign endpoint to
         Select(driver.find_element(By.ID, "id_product")).select_by_visible_text("QA Test")
         # submit
@@ -57,8 +55,7 @@ class EndpointTest(BaseTestCase):
         driver.find_element(By.LINK_TEXT, "New Endpoint").click()
         # Keep a good practice of clearing field before entering value
         # Endpoints
-        driver.find_element(By.ID, "id_endpoint").clear()
-        driver.find_element(By.ID, "id_endpoint").send_keys("https://example.com:1")
+        self.clear_and_send_keys(By.ID, "id_endpoint", "https://example.com:1")
         # Select product to assign endpoint to
         Select(driver.find_element(By.ID, "id_product")).select_by_visible_text("QA Test")
         # submit
@@ -74,8 +71,7 @@ class EndpointTest(BaseTestCase):
         driver.find_element(By.LINK_TEXT, "New Endpoint").click()
         # Keep a good practice of clearing field before entering value
         # Endpoints
-        driver.find_element(By.ID, "id_endpoint").clear()
-        driver.find_element(By.ID, "id_endpoint").send_keys("https://example.com:2")
+        self.clear_and_send_keys(By.ID, "id_endpoint", "https://example.com:2")
         # Select product to assign endpoint to
         Select(driver.find_element(By.ID, "id_product")).select_by_visible_text("QA Test")
         # submit
@@ -91,8 +87,7 @@ class EndpointTest(BaseTestCase):
         driver.find_element(By.LINK_TEXT, "New Endpoint").click()
         # Keep a good practice of clearing field before entering value
         # Endpoints
-        driver.find_element(By.ID, "id_endpoint").clear()
-        driver.find_element(By.ID, "id_endpoint").send_keys("https://example.com:3")
+        self.clear_and_send_keys(By.ID, "id_endpoint", "https://example.com:3")
         # Select product to assign endpoint to
         Select(driver.find_element(By.ID, "id_product")).select_by_visible_text("QA Test")
         # submit
@@ -108,8 +103,7 @@ class EndpointTest(BaseTestCase):
         driver.find_element(By.LINK_TEXT, "New Endpoint").click()
         # Keep a good practice of clearing field before entering value
         # Endpoints
-        driver.find_element(By.ID, "id_endpoint").clear()
-        driver.find_element(By.ID, "id_endpoint").send_keys("https://example.com:4")
+        self.clear_and_send_keys(By.ID, "id_endpoint", "https://example.com:4")
         # Select product to assign endpoint to
         Select(driver.find_element(By.ID, "id_product")).select_by_visible_text("QA Test")
         # submit
@@ -125,8 +119,7 @@ class EndpointTest(BaseTestCase):
         driver.find_element(By.LINK_TEXT, "New Endpoint").click()
         # Keep a good practice of clearing field before entering value
         # Endpoints
-        driver.find_element(By.ID, "id_endpoint").clear()
-        driver.find_element(By.ID, "id_endpoint").send_keys("https://example.com:5")
+        self.clear_and_send_keys(By.ID, "id_endpoint", "https://example.com:5")
         # Select product to assign endpoint to
         Select(driver.find_element(By.ID, "id_product")).select_by_visible_text("QA Test")
         # submit
@@ -147,13 +140,10 @@ class EndpointTest(BaseTestCase):
         driver.find_element(By.ID, "dropdownMenu1").click()
         # "Click" the Edit Endpoint
         driver.find_element(By.LINK_TEXT, "Edit Endpoint").click()
-        # Clear the old endpoint host name
-        driver.find_element(By.ID, "id_host").clear()
-        # Fill in the endpoint host name
-        driver.find_element(By.ID, "id_host").send_keys("rnd.moving.com")
+        # Clear the old endpoint host name and fill in the new one
+        self.clear_and_send_keys(By.ID, "id_host", "rnd.moving.com")
         # Fill in port for endpoint
-        driver.find_element(By.ID, "id_port").clear()
-        driver.find_element(By.ID, "id_port").send_keys("8080")
+        self.clear_and_send_keys(By.ID, "id_port", "8080")
         # "Click" the submit button to complete the transaction
         driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
         # Query the site to determine if the product has been added
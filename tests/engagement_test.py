@@ -31,8 +31,7 @@ class EngagementTest(BaseTestCase):
         driver.find_element(By.PARTIAL_LINK_TEXT, "Add New Engagement").click()
         driver.find_element(By.ID, "id_name").send_keys("test engagement")
         driver.find_element(By.ID, "id_name").send_keys("\tthis is engagement test.")
-        driver.find_element(By.ID, "id_test_strategy").clear()
-        driver.find_element(By.ID, "id_test_strategy").send_keys("http://localhost:5000")
+        self.clear_and_send_keys(By.ID, "id_test_strategy", "http://localhost:5000")
         Select(driver.find_element(By.ID, "id_status")).select_by_visible_text("In Progress")
         driver.find_element(By.CSS_SELECTOR, "input[value='Done']").click()
 
@@ -46,8 +45,7 @@ class EngagementTest(BaseTestCase):
         driver.find_element(By.LINK_TEXT, "test engagement").click()
         driver.find_element(By.ID, "dropdownMenu1").click()
         driver.find_element(By.LINK_TEXT, "Edit Engagement").click()
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("edited test engagement")
+        self.clear_and_send_keys(By.ID, "id_name", "edited test engagement")
         Select(driver.find_element(By.ID, "id_status")).select_by_visible_text("In Progress")
         driver.find_element(By.CSS_SELECTOR, "input[value='Done']").click()
 
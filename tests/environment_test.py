@@ -11,10 +11,8 @@ class EnvironmentTest(BaseTestCase):
     def login_page(self):
         driver = self.driver
         driver.get(self.base_url + "login")
-        driver.find_element(By.ID, "id_username").clear()
-        driver.find_element(By.ID, "id_username").send_keys(os.environ["DD_ADMIN_USER"])
-        driver.find_element(By.ID, "id_password").clear()
-        driver.find_element(By.ID, "id_password").send_keys(os.environ["DD_ADMIN_PASSWORD"])
+        self.clear_and_send_keys(By.ID, "id_username", os.environ["DD_ADMIN_USER"])
+        self.clear_and_send_keys(By.ID, "id_password", os.environ["DD_ADMIN_PASSWORD"])
         driver.find_element(By.CSS_SELECTOR, "button.btn.btn-success").click()
         return driver
 
@@ -23,8 +21,7 @@ class EnvironmentTest(BaseTestCase):
         driver.get(self.base_url + "dev_env")
         driver.find_element(By.ID, "dropdownMenu1").click()
         driver.find_element(By.LINK_TEXT, "New Environment").click()
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("environment test")
+        self.clear_and_send_keys(By.ID, "id_name", "environment test")
         driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
 
         self.assertTrue(self.is_success_message_present(text="Environment added successfully."))
@@ -33,8 +30,7 @@ class EnvironmentTest(BaseTestCase):
         driver = self.driver
         driver.get(self.base_url + "dev_env")
         driver.find_element(By.LINK_TEXT, "environment test").click()
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("Edited environment test")
+        self.clear_and_send_keys(By.ID, "id_name", "Edited environment test")
         driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
 
         self.assertTrue(self.is_success_message_present(text="Environment updated successfully."))
@@ -148,10 +148,8 @@ class FindingTest(BaseTestCase):
         # Click on `Edit Finding`
         driver.find_element(By.LINK_TEXT, "Edit Finding").click()
         # Set cvssv3 value and score
-        driver.find_element(By.ID, "id_cvssv3").clear()
-        driver.find_element(By.ID, "id_cvssv3").send_keys(cvssv3_value)
-        driver.find_element(By.ID, "id_cvssv3_score").clear()
-        driver.find_element(By.ID, "id_cvssv3_score").send_keys(str(cvssv3_score))
+        self.clear_and_send_keys(By.ID, "id_cvssv3", cvssv3_value)
+        self.clear_and_send_keys(By.ID, "id_cvssv3_score", str(cvssv3_score))
         # Submit the form
         driver.find_element(By.XPATH, "//input[@name='_Finished']").click()
 
@@ -283,8 +281,7 @@ class FindingTest(BaseTestCase):
         driver.find_element(By.LINK_TEXT, "App Vulnerable to XSS").click()
 
         # Notes are on the view_test page
-        driver.find_element(By.ID, "id_entry").clear()
-        driver.find_element(By.ID, "id_entry").send_keys("This is a sample note for all to see.")
+        self.clear_and_send_keys(By.ID, "id_entry", "This is a sample note for all to see.")
         # "Click" the submit button to complete the transaction
         driver.find_element(By.XPATH, "//input[@value='Add Note']").click()
 
@@ -316,8 +313,7 @@ class FindingTest(BaseTestCase):
         reviewer_option = element.find_elements(By.TAG_NAME, "option")[0]
         Select(element).select_by_value(reviewer_option.get_attribute("value"))
         # Add Review notes
-        driver.find_element(By.ID, "id_entry").clear()
-        driver.find_element(By.ID, "id_entry").send_keys("This is to be reviewed critically. Make sure it is well handled.")
+        self.clear_and_send_keys(By.ID, "id_entry", "This is to be reviewed critically. Make sure it is well handled.")
         # Click 'Mark for review'
         driver.find_element(By.NAME, "submit").click()
         # Query the site to determine if the finding has been added
@@ -339,8 +335,7 @@ class FindingTest(BaseTestCase):
         driver.find_element(By.ID, "id_active").click()
         driver.find_element(By.ID, "id_verified").click()
         # Add Review notes
-        driver.find_element(By.ID, "id_entry").clear()
-        driver.find_element(By.ID, "id_entry").send_keys("This has been reviewed and confirmed. A fix needed here.")
+        self.clear_and_send_keys(By.ID, "id_entry", "This has been reviewed and confirmed. A fix needed here.")
         # Click 'Clear reveiw' button
         driver.find_element(By.NAME, "submit").click()
         # Query the site to determine if the finding has been added
@@ -533,8 +528,7 @@ class FindingTest(BaseTestCase):
         driver.find_element(By.LINK_TEXT, "Use This Template").click()
         self.assertNoConsoleErrors()
 
-        driver.find_element(By.ID, "id_title").clear()
-        driver.find_element(By.ID, "id_title").send_keys("App Vulnerable to XSS from Template")
+        self.clear_and_send_keys(By.ID, "id_title", "App Vulnerable to XSS from Template")
         self.assertNoConsoleErrors()
         # Click the 'finished' button to submit
         driver.find_element(By.ID, "id_finished").click()
@@ -567,9 +561,8 @@ class FindingTest(BaseTestCase):
         logger.info("\nClicking on the template \n")
         driver.find_element(By.LINK_TEXT, "Use This Template").click()
         self.assertNoConsoleErrors()
-        driver.find_element(By.ID, "id_title").clear()
         # Backslash causes error
-        driver.find_element(By.ID, "id_title").send_keys("App Vulnerable to XSS from \\Template")
+        self.clear_and_send_keys(By.ID, "id_title", "App Vulnerable to XSS from \\Template")
         self.assertNoConsoleErrors()
         # Click the 'finished' button to submit
         driver.find_element(By.ID, "id_finished").click()
@@ -22,8 +22,7 @@ class GroupTest(BaseTestCase):
         driver.find_element(By.LINK_TEXT, "New Group").click()
         # Fill in the Necessary group Details
         # name
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("Group Name")
+        self.clear_and_send_keys(By.ID, "id_name", "Group Name")
         # "Click" the submit button to complete the transaction
         driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
         # Assert status is success
@@ -40,16 +39,14 @@ class GroupTest(BaseTestCase):
         # so we would have to select specific group by filtering list of groups
         driver.find_element(By.ID, "show-filters").click()
         # Insert name to filter by into name box
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("Group Name")
+        self.clear_and_send_keys(By.ID, "id_name", "Group Name")
         # click on 'apply filter' button
         driver.find_element(By.ID, "apply").click()
         # only the needed group is now available, proceed with opening the context menu and clicking 'Edit' button
         driver.find_element(By.ID, "dropdownMenuGroup").click()
         driver.find_element(By.ID, "editGroup").click()
         # Edit name
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("Another Name")
+        self.clear_and_send_keys(By.ID, "id_name", "Another Name")
         # Select the role 'Reader'
         Select(driver.find_element(By.ID, "id_role")).select_by_visible_text("Reader")
         # "Click" the submit button to complete the transaction
@@ -136,8 +133,7 @@ class GroupTest(BaseTestCase):
         # so we would have to select specific group by filtering list of groups
         driver.find_element(By.ID, "show-filters").click()
         # Insert name to filter by into name box
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("Another Name")
+        self.clear_and_send_keys(By.ID, "id_name", "Another Name")
         # click on 'apply filter' button
         driver.find_element(By.ID, "apply").click()
         # only the needed group is now available, proceed with clicking 'Delete' button
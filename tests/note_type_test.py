@@ -12,10 +12,8 @@ class NoteTypeTest(BaseTestCase):
         driver.get(self.base_url + "note_type")
         driver.find_element(By.ID, "dropdownMenu1").click()
         driver.find_element(By.LINK_TEXT, "Add Note Type").click()
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("test note type")
-        driver.find_element(By.ID, "id_description").clear()
-        driver.find_element(By.ID, "id_description").send_keys("Test note type description")
+        self.clear_and_send_keys(By.ID, "id_name", "test note type")
+        self.clear_and_send_keys(By.ID, "id_description", "Test note type description")
         driver.find_element(By.ID, "id_is_single").click()
         driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
 
@@ -25,8 +23,7 @@ class NoteTypeTest(BaseTestCase):
         driver = self.driver
         driver.get(self.base_url + "note_type")
         driver.find_element(By.LINK_TEXT, "Edit Note Type").click()
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("Edited test note type")
+        self.clear_and_send_keys(By.ID, "id_name", "Edited test note type")
         driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
 
         self.assertTrue(self.is_success_message_present(text="Note type updated successfully."))
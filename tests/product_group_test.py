@@ -145,8 +145,7 @@ class ProductGroupTest(BaseTestCase):
         # so we would have to select specific group by filtering list of groups
         driver.find_element(By.ID, "show-filters").click()
         # Insert name to filter by into name box
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("Group Name")
+        self.clear_and_send_keys(By.ID, "id_name", "Group Name")
         # click on 'apply filter' button
         driver.find_element(By.ID, "apply").click()
         # only the needed group is now available, proceed with opening the context menu and clicking 'Edit' button
@@ -45,8 +45,7 @@ class ProductTest(BaseTestCase):
         # "Click" the add prodcut button
         driver.find_element(By.LINK_TEXT, "Add Product").click()
         # Fill in th product name
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("QA Test")
+        self.clear_and_send_keys(By.ID, "id_name", "QA Test")
         # Tab into the description area to fill some text
         # Couldnt find a way to get into the box with selenium
         driver.find_element(By.ID, "id_name").send_keys("\tThis is just a test. Be very afraid.")
@@ -153,8 +152,7 @@ class ProductTest(BaseTestCase):
         # fill up at least all required input field options.
         # fields: 'Name', 'Description', 'Target Start', 'Target End', 'Testing Lead' and 'Status'
         # engagement name
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("Beta Test")
+        self.clear_and_send_keys(By.ID, "id_name", "Beta Test")
         # engagement description
         # Tab into the description area to fill some text
         # Couldnt find a way to get into the box with selenium
@@ -186,10 +184,8 @@ class ProductTest(BaseTestCase):
         # Click on the 'Engagement dropdown button'
         driver.find_element(By.ID, "addTechnology").click()
         # Keep a good practice of clearing field before entering value
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("Technology Test")
-        driver.find_element(By.ID, "id_version").clear()
-        driver.find_element(By.ID, "id_version").send_keys("2.1.0-RELEASE")
+        self.clear_and_send_keys(By.ID, "id_name", "Technology Test")
+        self.clear_and_send_keys(By.ID, "id_version", "2.1.0-RELEASE")
         # "Click" the Submit button to Add the technology
         driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
         # Assert of the query to dtermine status of failure
@@ -213,10 +209,8 @@ class ProductTest(BaseTestCase):
         driver.find_elements(By.NAME, "dropdownManageTechnologies")[0].click()
         driver.find_elements(By.NAME, "editTechnology")[0].click()
         # Keep a good practice of clearing field before entering value
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("Technology Changed")
-        driver.find_element(By.ID, "id_version").clear()
-        driver.find_element(By.ID, "id_version").send_keys("2.2.0-RELEASE")
+        self.clear_and_send_keys(By.ID, "id_name", "Technology Changed")
+        self.clear_and_send_keys(By.ID, "id_version", "2.2.0-RELEASE")
         # "Click" the Submit button to change the technology
         driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
         # Assert of the query to dtermine status of failure
@@ -263,8 +257,7 @@ class ProductTest(BaseTestCase):
         # fill up at least all required input field options.
         # fields: 'Title', 'Date', 'Severity', 'Description', 'Mitigation' and 'Impact'
         # finding Title
-        driver.find_element(By.ID, "id_title").clear()
-        driver.find_element(By.ID, "id_title").send_keys("App Vulnerable to XSS")
+        self.clear_and_send_keys(By.ID, "id_title", "App Vulnerable to XSS")
         # finding Date as a default value and can be safely skipped
         # finding Severity
         Select(driver.find_element(By.ID, "id_severity")).select_by_visible_text("High")
@@ -315,8 +308,7 @@ class ProductTest(BaseTestCase):
         driver.find_element(By.LINK_TEXT, "Add New Endpoint").click()
         # Keep a good practice of clearing field before entering value
         # Endpoints
-        driver.find_element(By.ID, "id_endpoint").clear()
-        driver.find_element(By.ID, "id_endpoint").send_keys("strange.prod.dev\n123.45.6.30")
+        self.clear_and_send_keys(By.ID, "id_endpoint", "strange.prod.dev\n123.45.6.30")
         # submit
         driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
         # Query the site to determine if the finding has been added
@@ -339,11 +331,9 @@ class ProductTest(BaseTestCase):
         driver.find_element(By.LINK_TEXT, "Add Custom Fields").click()
         # Keep a good practice of clearing field before entering value
         # Custom Name
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("Security Level")
+        self.clear_and_send_keys(By.ID, "id_name", "Security Level")
         # Custom Value
-        driver.find_element(By.ID, "id_value").clear()
-        driver.find_element(By.ID, "id_value").send_keys("Loose")
+        self.clear_and_send_keys(By.ID, "id_value", "Loose")
         # submit
         driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
         # Query the site to determine if the finding has been added
@@ -368,8 +358,7 @@ class ProductTest(BaseTestCase):
         driver.find_element(By.LINK_TEXT, "Edit Custom Fields").click()
         # Keep a good practice of clearing field before entering value
         # Edit Custom Value of First field
-        driver.find_element(By.XPATH, "//input[@value='Loose']").clear()
-        driver.find_element(By.XPATH, "//input[@value='Loose']").send_keys("Strong")
+        self.clear_and_send_keys(By.XPATH, "//input[@value='Loose']", "Strong")
         # submit
         driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
         # Query the site to determine if the finding has been added
@@ -394,8 +383,7 @@ class ProductTest(BaseTestCase):
         # Keep a good practice of clearing field before entering value
         # Just fill up to main required fields: 'File path' nd 'review status'
         # Full File path
-        driver.find_element(By.ID, "id_path").clear()
-        driver.find_element(By.ID, "id_path").send_keys("/strange/folder/")
+        self.clear_and_send_keys(By.ID, "id_path", "/strange/folder/")
         # REview Status
         Select(driver.find_element(By.ID, "id_review_status")).select_by_visible_text("Untracked")
         # submit
@@ -422,8 +410,7 @@ class ProductTest(BaseTestCase):
         # Edit Custom Value of First field
         driver.find_element(By.LINK_TEXT, "Edit").click()
         # Edit full file path
-        driver.find_element(By.ID, "id_path").clear()
-        driver.find_element(By.ID, "id_path").send_keys("/unknown/folder/")
+        self.clear_and_send_keys(By.ID, "id_path", "/unknown/folder/")
         # submit
         driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
         # Query the site to determine if the Tracking file has been updated
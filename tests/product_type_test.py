@@ -17,8 +17,7 @@ class ProductTypeTest(BaseTestCase):
         driver.get(self.base_url + "product/type")
         driver.find_element(By.ID, "dropdownMenu1").click()
         driver.find_element(By.LINK_TEXT, "Add Product Type").click()
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("Product test type")
+        self.clear_and_send_keys(By.ID, "id_name", "Product test type")
         driver.find_element(By.ID, "id_critical_product").click()
         driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
 
@@ -37,8 +36,7 @@ class ProductTypeTest(BaseTestCase):
         driver.find_element(By.ID, "dropdownMenuProductType").click()
         driver.find_element(By.PARTIAL_LINK_TEXT, "Add Product").click()
         # Fill in th product name
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("QA Test PT")
+        self.clear_and_send_keys(By.ID, "id_name", "QA Test PT")
         # Tab into the description area to fill some text
         # Couldnt find a way to get into the box with selenium
         driver.find_element(By.ID, "id_name").send_keys("\tThis is just a test. Be very afraid.")
@@ -65,8 +63,7 @@ class ProductTypeTest(BaseTestCase):
         driver.get(self.base_url + "product/type")
         driver.find_element(By.ID, "dropdownMenuProductType").click()
         driver.find_element(By.PARTIAL_LINK_TEXT, "Edit").click()
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("Edited product test type")
+        self.clear_and_send_keys(By.ID, "id_name", "Edited product test type")
         driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
 
         self.assertTrue(self.is_success_message_present(text="Product type updated successfully."))
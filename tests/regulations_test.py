@@ -11,10 +11,8 @@ class RegulationTest(BaseTestCase):
     def login_page(self):
         driver = self.driver
         driver.get(self.base_url + "login")
-        driver.find_element(By.ID, "id_username").clear()
-        driver.find_element(By.ID, "id_username").send_keys(os.environ["DD_ADMIN_USER"])
-        driver.find_element(By.ID, "id_password").clear()
-        driver.find_element(By.ID, "id_password").send_keys(os.environ["DD_ADMIN_PASSWORD"])
+        self.clear_and_send_keys(By.ID, "id_username", os.environ["DD_ADMIN_USER"])
+        self.clear_and_send_keys(By.ID, "id_password", os.environ["DD_ADMIN_PASSWORD"])
         driver.find_element(By.CSS_SELECTOR, "button.btn.btn-success").click()
         return driver
 
@@ -24,17 +22,12 @@ class RegulationTest(BaseTestCase):
         driver.find_element(By.LINK_TEXT, "Regulations").click()
         driver.find_element(By.ID, "dropdownMenu1").click()
         driver.find_element(By.LINK_TEXT, "Add regulation").click()
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("PSA_TEST")
-        driver.find_element(By.ID, "id_acronym").clear()
-        driver.find_element(By.ID, "id_acronym").send_keys("PSA_TEST")
+        self.clear_and_send_keys(By.ID, "id_name", "PSA_TEST")
+        self.clear_and_send_keys(By.ID, "id_acronym", "PSA_TEST")
         driver.find_element(By.CSS_SELECTOR, "option:nth-child(6)").click()
-        driver.find_element(By.ID, "id_jurisdiction").clear()
-        driver.find_element(By.ID, "id_jurisdiction").send_keys("Europe")
-        driver.find_element(By.ID, "id_description").clear()
-        driver.find_element(By.ID, "id_description").send_keys("Few words abot PSA")
-        driver.find_element(By.ID, "id_reference").clear()
-        driver.find_element(By.ID, "id_reference").send_keys("http://www.psa.eu")
+        self.clear_and_send_keys(By.ID, "id_jurisdiction", "Europe")
+        self.clear_and_send_keys(By.ID, "id_description", "Few words abot PSA")
+        self.clear_and_send_keys(By.ID, "id_reference", "http://www.psa.eu")
         driver.find_element(By.CSS_SELECTOR, ".col-sm-offset-2 > .btn").click()
 
         self.assertTrue(self.is_success_message_present(text="Regulation Successfully Created."))
@@ -44,8 +37,7 @@ class RegulationTest(BaseTestCase):
         driver.get(self.base_url + "regulations")
         driver.find_element(By.LINK_TEXT, "Regulations").click()
         driver.find_element(By.LINK_TEXT, "PSA_TEST").click()
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("Edited PSA test")
+        self.clear_and_send_keys(By.ID, "id_name", "Edited PSA test")
         driver.find_element(By.ID, "submit").click()
         self.assertTrue(self.is_success_message_present(text="Regulation Successfully Updated."))
 
@@ -10,82 +10,70 @@ class SearchTests(BaseTestCase):
     def test_search(self):
         # very basic search test to see if it doesn't 500
         driver = self.goto_some_page()
-        driver.find_element(By.ID, "simple_search").clear()
-        driver.find_element(By.ID, "simple_search").send_keys("finding")
+        self.clear_and_send_keys(By.ID, "simple_search", "finding")
         driver.find_element(By.ID, "simple_search_submit").click()
 
     def test_search_vulnerability_id(self):
         # very basic search test to see if it doesn't 500
         driver = self.goto_some_page()
-        driver.find_element(By.ID, "simple_search").clear()
-        driver.find_element(By.ID, "simple_search").send_keys("vulnerability_id:CVE-2020-12345")
+        self.clear_and_send_keys(By.ID, "simple_search", "vulnerability_id:CVE-2020-12345")
         driver.find_element(By.ID, "simple_search_submit").click()
 
-        driver.find_element(By.ID, "simple_search").clear()
-        driver.find_element(By.ID, "simple_search").send_keys("CVE-2020-12345")
+        self.clear_and_send_keys(By.ID, "simple_search", "CVE-2020-12345")
         driver.find_element(By.ID, "simple_search_submit").click()
 
     def test_search_tag(self):
         # very basic search test to see if it doesn't 500
         driver = self.goto_some_page()
-        driver.find_element(By.ID, "simple_search").clear()
-        driver.find_element(By.ID, "simple_search").send_keys("tag:magento")
+        self.clear_and_send_keys(By.ID, "simple_search", "tag:magento")
         driver.find_element(By.ID, "simple_search_submit").click()
 
     def test_search_product_tag(self):
         # very basic search test to see if it doesn't 500
         driver = self.goto_some_page()
-        driver.find_element(By.ID, "simple_search").clear()
-        driver.find_element(By.ID, "simple_search").send_keys("product-tag:java")
+        self.clear_and_send_keys(By.ID, "simple_search", "product-tag:java")
         driver.find_element(By.ID, "simple_search_submit").click()
 
     def test_search_engagement_tag(self):
         # very basic search test to see if it doesn't 500
         driver = self.goto_some_page()
-        driver.find_element(By.ID, "simple_search").clear()
-        driver.find_element(By.ID, "simple_search").send_keys("engagement-tag:php")
+        self.clear_and_send_keys(By.ID, "simple_search", "engagement-tag:php")
         driver.find_element(By.ID, "simple_search_submit").click()
 
     def test_search_test_tag(self):
         # very basic search test to see if it doesn't 500
         driver = self.goto_some_page()
-        driver.find_element(By.ID, "simple_search").clear()
-        driver.find_element(By.ID, "simple_search").send_keys("test-tag:go")
+        self.clear_and_send_keys(By.ID, "simple_search", "test-tag:go")
         driver.find_element(By.ID, "simple_search_submit").click()
 
     def test_search_tags(self):
         # very basic search test to see if it doesn't 500
         driver = self.goto_some_page()
-        driver.find_element(By.ID, "simple_search").clear()
-        driver.find_element(By.ID, "simple_search").send_keys("tags:php")
+        self.clear_and_send_keys(By.ID, "simple_search", "tags:php")
         driver.find_element(By.ID, "simple_search_submit").click()
 
     def test_search_product_tags(self):
         # very basic search test to see if it doesn't 500
         driver = self.goto_some_page()
-        driver.find_element(By.ID, "simple_search").clear()
-        driver.find_element(By.ID, "simple_search").send_keys("product-tags:java")
+        self.clear_and_send_keys(By.ID, "simple_search", "product-tags:java")
         driver.find_element(By.ID, "simple_search_submit").click()
 
     def test_search_engagement_tags(self):
         # very basic search test to see if it doesn't 500
         driver = self.goto_some_page()
-        driver.find_element(By.ID, "simple_search").clear()
-        driver.find_element(By.ID, "simple_search").send_keys("engagement-tags:php")
+        self.clear_and_send_keys(By.ID, "simple_search", "engagement-tags:php")
         driver.find_element(By.ID, "simple_search_submit").click()
 
     def test_search_test_tags(self):
         # very basic search test to see if it doesn't 500
         driver = self.goto_some_page()
-        driver.find_element(By.ID, "simple_search").clear()
-        driver.find_element(By.ID, "simple_search").send_keys("test-tags:go")
+        self.clear_and_send_keys(By.ID, "simple_search", "test-tags:go")
         driver.find_element(By.ID, "simple_search_submit").click()
 
     def test_search_id(self):
         # very basic search test to see if it doesn't 500
         driver = self.goto_some_page()
-        driver.find_element(By.ID, "simple_search").clear()
-        driver.find_element(By.ID, "simple_search").send_keys("id:1")
+        self.clear_and_send_keys(By.ID, "simple_search", "id:1")
         driver.find_element(By.ID, "simple_search_submit").click()
 
 
@@ -11,10 +11,8 @@ class SLAConfigurationTest(BaseTestCase):
     def login_page(self):
         driver = self.driver
         driver.get(self.base_url + "login")
-        driver.find_element(By.ID, "id_username").clear()
-        driver.find_element(By.ID, "id_username").send_keys(os.environ["DD_ADMIN_USER"])
-        driver.find_element(By.ID, "id_password").clear()
-        driver.find_element(By.ID, "id_password").send_keys(os.environ["DD_ADMIN_PASSWORD"])
+        self.clear_and_send_keys(By.ID, "id_username", os.environ["DD_ADMIN_USER"])
+        self.clear_and_send_keys(By.ID, "id_password", os.environ["DD_ADMIN_PASSWORD"])
         driver.find_element(By.CSS_SELECTOR, "button.btn.btn-success").click()
         return driver
 
@@ -23,18 +21,12 @@ class SLAConfigurationTest(BaseTestCase):
         driver.get(self.base_url + "sla_config")
         driver.find_element(By.ID, "dropdownMenu1").click()
         driver.find_element(By.LINK_TEXT, "Add SLA Configuration").click()
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("Test SLA Configuration")
-        driver.find_element(By.ID, "id_description").clear()
-        driver.find_element(By.ID, "id_description").send_keys("This is a Test SLA Configuration for the purposes of testing")
-        driver.find_element(By.ID, "id_critical").clear()
-        driver.find_element(By.ID, "id_critical").send_keys("1")
-        driver.find_element(By.ID, "id_critical").clear()
-        driver.find_element(By.ID, "id_critical").send_keys("2")
-        driver.find_element(By.ID, "id_critical").clear()
-        driver.find_element(By.ID, "id_critical").send_keys("3")
-        driver.find_element(By.ID, "id_critical").clear()
-        driver.find_element(By.ID, "id_critical").send_keys("4")
+        self.clear_and_send_keys(By.ID, "id_name", "Test SLA Configuration")
+        self.clear_and_send_keys(By.ID, "id_description", "This is a Test SLA Configuration for the purposes of testing")
+        self.clear_and_send_keys(By.ID, "id_critical", "1")
+        self.clear_and_send_keys(By.ID, "id_critical", "2")
+        self.clear_and_send_keys(By.ID, "id_critical", "3")
+        self.clear_and_send_keys(By.ID, "id_critical", "4")
         driver.find_element(By.VALUE, "Submit").click()
 
         self.assertTrue(self.is_success_message_present(text="SLA configuration Successfully Created."))
@@ -43,8 +35,7 @@ class SLAConfigurationTest(BaseTestCase):
         driver = self.driver
         driver.get(self.base_url + "sla_config")
         driver.find_element(By.LINK_TEXT, "Test SLA Configuration").click()
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("Edited Test SLA Configuration test")
+        self.clear_and_send_keys(By.ID, "id_name", "Edited Test SLA Configuration test")
         driver.find_element(By.ID, "submit").click()
         self.assertTrue(self.is_success_message_present(text="SLA configuration Successfully Updated."))
 
@@ -66,8 +66,7 @@ class TestUnitTest(BaseTestCase):
         # fill up at least all required input field options.
         # fields: 'Name', 'Description', 'Target Start', 'Target End', 'Testing Lead' and 'Status'
         # engagement name
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("Beta Test")
+        self.clear_and_send_keys(By.ID, "id_name", "Beta Test")
         # engagement description
         # Tab into the description area to fill some text
         # Couldnt find a way to get into the box with selenium
@@ -82,8 +81,7 @@ class TestUnitTest(BaseTestCase):
         driver.find_element(By.NAME, "_Add Tests").click()
         # Fill at least required fields needed to create Test
         # Test title
-        driver.find_element(By.ID, "id_title").clear()  # clear field before inserting anything
-        driver.find_element(By.ID, "id_title").send_keys("Quick Security Testing")
+        self.clear_and_send_keys(By.ID, "id_title", "Quick Security Testing")
         # Select Test type
         Select(driver.find_element(By.ID, "id_test_type")).select_by_visible_text("Manual Code Review")
         # skip Target start and Target end leaving their default values
@@ -128,8 +126,7 @@ class TestUnitTest(BaseTestCase):
         # "Click" the dropdown button to see options
         driver.find_element(By.ID, "dropdownMenu1").click()
         # Notes are on the view_test page
-        driver.find_element(By.ID, "id_entry").clear()
-        driver.find_element(By.ID, "id_entry").send_keys("This is a sample note for all to see.")
+        self.clear_and_send_keys(By.ID, "id_entry", "This is a sample note for all to see.")
         # "Click" the submit button to complete the transaction
         driver.find_element(By.XPATH, "//input[@value='Add Note']").click()
         # Query the site to determine if the Test has been updated
@@ -154,8 +151,7 @@ class TestUnitTest(BaseTestCase):
         # fill up at least all required input field options.
         # fields: 'Title', 'Date', 'Severity', 'Description', 'Mitigation' and 'Impact'
         # finding Title
-        driver.find_element(By.ID, "id_title").clear()
-        driver.find_element(By.ID, "id_title").send_keys("App Vulnerable to XSS2")
+        self.clear_and_send_keys(By.ID, "id_title", "App Vulnerable to XSS2")
         # finding Date as a default value and can be safely skipped
         # finding Severity
         Select(driver.find_element(By.ID, "id_severity")).select_by_visible_text("High")
@@ -197,8 +193,7 @@ class TestUnitTest(BaseTestCase):
 
         # Enter the title of the stub finding
         # Keep a good practice of clearing field before entering value
-        driver.find_element(By.ID, "quick_add_finding").clear()
-        driver.find_element(By.ID, "quick_add_finding").send_keys("App Vulnerable to XSS3")
+        self.clear_and_send_keys(By.ID, "quick_add_finding", "App Vulnerable to XSS3")
         # Click on Add Potential Finding
         driver.find_element(By.ID, "the_button").click()
 
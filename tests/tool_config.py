@@ -56,8 +56,7 @@ class ToolConfigTest(BaseTestCase):
         # Check if ToolType is selected
         self.assertTrue(driver.find_element(By.XPATH, "//select[@id='id_tool_type']/option[contains(text(),'Edgescan')]").is_selected())
         # Fill in th ToolConfig name
-        driver.find_element(By.ID, "id_name").clear()
-        driver.find_element(By.ID, "id_name").send_keys("First Edgescan Tool Config")
+        self.clear_and_send_keys(By.ID, "id_name", "First Edgescan Tool Config")
         # Choose Ath type
         Select(driver.find_element(By.ID, "id_authentication_type")).select_by_visible_text("API Key")
         # "Click" the submit button to complete the transaction
@@ -82,8 +81,7 @@ class ToolConfigTest(BaseTestCase):
         self.goto_add_api_scan_configuration(driver)
         Select(driver.find_element(By.ID, "id_tool_configuration")).select_by_visible_text("First Edgescan Tool Config")
         # Fill in some service key
-        driver.find_element(By.ID, "id_service_key_1").clear()
-        driver.find_element(By.ID, "id_service_key_1").send_keys("service key")
+        self.clear_and_send_keys(By.ID, "id_service_key_1", "service key")
         # "Click" the submit button to complete the transaction
         driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
 
@@ -22,20 +22,15 @@ class UserTest(BaseTestCase):
         # username, first name, last name, email, and permissions
         # Don't forget to clear before inserting
         # username
-        driver.find_element(By.ID, "id_username").clear()
-        driver.find_element(By.ID, "id_username").send_keys("propersahm")
+        self.clear_and_send_keys(By.ID, "id_username", "propersahm")
         # password
-        driver.find_element(By.ID, "id_password").clear()
-        driver.find_element(By.ID, "id_password").send_keys("Def3ctD0jo&")
+        self.clear_and_send_keys(By.ID, "id_password", "Def3ctD0jo&")
         # First Name
-        driver.find_element(By.ID, "id_first_name").clear()
-        driver.find_element(By.ID, "id_first_name").send_keys("Proper")
+        self.clear_and_send_keys(By.ID, "id_first_name", "Proper")
         # Last Name
-        driver.find_element(By.ID, "id_last_name").clear()
-        driver.find_element(By.ID, "id_last_name").send_keys("Samuel")
+        self.clear_and_send_keys(By.ID, "id_last_name", "Samuel")
         # Email Address
-        driver.find_element(By.ID, "id_email").clear()
-        driver.find_element(By.ID, "id_email").send_keys("propersam@example.com")
+        self.clear_and_send_keys(By.ID, "id_email", "propersam@example.com")
         # "Click" the submit button to complete the transaction
         driver.find_element(By.CSS_SELECTOR, "input.btn.btn-primary").click()
         # Query the site to determine if the user has been created
@@ -57,20 +52,15 @@ class UserTest(BaseTestCase):
         # username, first name, last name, email, and permissions
         # Don't forget to clear before inserting
         # username
-        driver.find_element(By.ID, "id_username").clear()
-        driver.find_element(By.ID, "id_username").send_keys("userWriter")
+        self.clear_and_send_keys(By.ID, "id_username", "userWriter")
         # password
-        driver.find_element(By.ID, "id_password").clear()
-        driver.find_element(By.ID, "id_password").send_keys("Def3ctD0jo&")
+        self.clear_and_send_keys(By.ID, "id_password", "Def3ctD0jo&")
         # First Name
-        driver.find_element(By.ID, "id_first_name").clear()
-        driver.find_element(By.ID, "id_first_name").send_keys("Writer")
+        self.clear_and_send_keys(By.ID, "id_first_name", "Writer")
         # Last Name
-        driver.find_element(By.ID, "id_last_name").clear()
-        driver.find_element(By.ID, "id_last_name").send_keys("Permission")
+        self.clear_and_send_keys(By.ID, "id_last_name", "Permission")
         # Email Address
-        driver.find_element(By.ID, "id_email").clear()
-        driver.find_element(By.ID, "id_email").send_keys("permissionTest@defectdojo.local")
+        self.clear_and_send_keys(By.ID, "id_email", "permissionTest@defectdojo.local")
         # Select the role 'Reader'
         Select(driver.find_element(By.ID, "id_role")).select_by_visible_text("Writer")
         # "Click" the submit button to complete the transaction
@@ -111,8 +101,7 @@ class UserTest(BaseTestCase):
         # so we would have to select specific user by filtering list of users
         driver.find_element(By.ID, "show-filters").click()  # open d filters
         # Insert username to filter by into user name box
-        driver.find_element(By.ID, "id_username").clear()
-        driver.find_element(By.ID, "id_username").send_keys("propersahm")
+        self.clear_and_send_keys(By.ID, "id_username", "propersahm")
         # click on 'apply filter' button
         driver.find_element(By.ID, "apply").click()
         # only the needed user is now available, proceed with opening the context menu and clicking 'Edit' button
@@ -138,8 +127,7 @@ class UserTest(BaseTestCase):
         # so we would have to select specific user by filtering list of users
         driver.find_element(By.ID, "show-filters").click()  # open d filters
         # Insert username to filter by into user name box
-        driver.find_element(By.ID, "id_username").clear()
-        driver.find_element(By.ID, "id_username").send_keys("propersahm")
+        self.clear_and_send_keys(By.ID, "id_username", "propersahm")
         # click on 'apply filter' button
         driver.find_element(By.ID, "apply").click()
         # only the needed user is now available, proceed with clicking 'View' button
@@ -166,8 +154,7 @@ class UserTest(BaseTestCase):
         # so we would have to select specific user by filtering list of users
         driver.find_element(By.ID, "show-filters").click()  # open d filters
         # Insert username to filter by into user name box
-        driver.find_element(By.ID, "id_username").clear()
-        driver.find_element(By.ID, "id_username").send_keys("userWriter")
+        self.clear_and_send_keys(By.ID, "id_username", "userWriter")
         # click on 'apply filter' button
         driver.find_element(By.ID, "apply").click()
         # only the needed user is now available, proceed with clicking 'View' button
@@ -232,8 +219,7 @@ class UserTest(BaseTestCase):
         # so we would have to select specific user by filtering list of users
         driver.find_element(By.ID, "show-filters").click()  # open d filters
         # Insert username to filter by into user name box
-        driver.find_element(By.ID, "id_username").clear()
-        driver.find_element(By.ID, "id_username").send_keys("propersahm")
+        self.clear_and_send_keys(By.ID, "id_username", "propersahm")
         # click on 'apply filter' button
         driver.find_element(By.ID, "apply").click()
         # only the needed user is now available, proceed with opening the context menu and clicking 'Edit' button
@@ -253,8 +239,7 @@ class UserTest(BaseTestCase):
         # so we would have to select specific user by filtering list of users
         driver.find_element(By.ID, "show-filters").click()  # open d filters
         # Insert username to filter by into user name box
-        driver.find_element(By.ID, "id_username").clear()
-        driver.find_element(By.ID, "id_username").send_keys("propersahm")
+        self.clear_and_send_keys(By.ID, "id_username", "propersahm")
         # click on 'apply filter' button
         driver.find_element(By.ID, "apply").click()
         # only the needed user is now available, proceed with opening the context menu and clicking 'Edit' button
@@ -6,6 +6,7 @@ from itertools import chain
 from pathlib import Path
 from pprint import pformat
 
+from django.db.models import Count, Q
 from django.test import TestCase
 from django.urls import reverse
 from django.utils import timezone
@@ -180,6 +181,21 @@ class DojoTestUtilsMixin:
         jira_issues = JIRA_Issue.objects.filter(finding_group__test=test)
         self.assertEqual(count, len(jira_issues))
 
+    def get_test_finding_ids(self, test_id, **filters):
+        # same order as the findings api, for tests that only need the ids and not the serialized findings
+        return list(Finding.objects.filter(test_id=test_id, **filters).order_by("id").values_list("id", flat=True))
+
+    def assert_jira_issue_counts_in_test(self, test_id, issue_count, group_issue_count):
+        # counts both the finding and the finding group jira issues of the test in a single query
+        counts = JIRA_Issue.objects.filter(Q(finding__test_id=test_id) | Q(finding_group__test_id=test_id)).aggregate(
+            issues=Count("id", filter=Q(finding__test_id=test_id)),
+            group_issues=Count("id", filter=Q(finding_group__test_id=test_id)),
+        )
+        with self.subTest("jira issues"):
+            self.assertEqual(issue_count, counts["issues"])
+        with self.subTest("jira group issues"):
+            self.assertEqual(group_issue_count, counts["group_issues"])
+
     def model_to_dict(self, instance):
         opts = instance._meta
         data = {}
@@ -341,8 +357,8 @@ class DojoTestUtilsMixin:
 
     def set_jira_push_all_issues(self, engagement_or_product):
         jira_project = jira_helper.get_jira_project(engagement_or_product)
-        jira_project.push_all_issues = True
-        jira_project.save()
+        # only the flag changes, so update just that column instead of saving the whole jira project
+        JIRA_Project.objects.filter(pk=jira_project.pk).update(push_all_issues=True)
 
     def add_product_jira_with_data(self, data, expected_delta_jira_project_db, expect_redirect_to=None, *, expect_200=False):
         jira_project_count_before = self.db_jira_project_count()
@@ -409,12 +425,17 @@ class DojoTestUtilsMixin:
         return response
 
     def get_jira_issue_status(self, finding_id):
-        finding = Finding.objects.get(id=finding_id)
-        return jira_helper.get_jira_status(finding)
+        return self.get_jira_issue(finding_id).fields.status
 
     def get_jira_issue_priority(self, finding_id):
-        finding = Finding.objects.get(id=finding_id)
-        return jira_helper.get_jira_priortiy(finding)
+        return self.get_jira_issue(finding_id).fields.priority
+
+    def get_jira_issue(self, finding_id):
+        # fetches the jira issue of the finding, or of its group, once. for tests that check both status and priority
+        # the finding is only used to find the jira issue and project, so the test and engagement are joined in
+        finding = Finding.objects.select_related("test__engagement").get(id=finding_id)
+        jira_issue = finding.jira_issue if finding.has_jira_issue else finding.finding_group.jira_issue
+        return jira_helper.jira_get_issue(jira_helper.get_jira_project(finding), jira_issue.jira_id)
 
     def get_jira_issue_updated(self, finding_id):
         finding = Finding.objects.get(id=finding_id)
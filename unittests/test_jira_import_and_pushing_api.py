@@ -1,7 +1,9 @@
 # from unittest import skip
 import logging
+import os
 
 from crum import impersonate
+from django.db import transaction
 from django.urls import reverse
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
@@ -9,13 +11,21 @@ from vcr import VCR
 
 import dojo.risk_acceptance.helper as ra_helper
 from dojo.jira_link import helper as jira_helper
-from dojo.models import Finding, Finding_Group, JIRA_Instance, Risk_Acceptance, User
+from dojo.models import (
+    Engagement,
+    Finding,
+    Finding_Group,
+    JIRA_Instance,
+    Risk_Acceptance,
+    System_Settings,
+    User,
+    UserContactInfo,
+)
 
 from .dojo_test_case import (
     DojoVCRAPITestCase,
     get_unit_tests_path,
     get_unit_tests_scans_path,
-    toggle_system_setting_boolean,
     with_system_setting,
 )
 
@@ -28,11 +38,12 @@ logger = logging.getLogger(__name__)
 
 # the record_mode is set to 'once' by default. this means it will replay responses from the cassette, if there is a cassette.
 # otherwise it will create a new cassette and record responses. on the next run the cassette wil be used.
+# the record_mode can be overridden with the DD_VCR_RECORD_MODE environment variable.
 
 # if changing tests, you can best remove all cassettes before running the tests.
-# or you can temporarily set the record_mode to all the make it always go to the real JIRA and record all the traffic.
+# or you can run with DD_VCR_RECORD_MODE=all to make it always go to the real JIRA and record all the traffic.
 
-# when the tests are finished, you'll have to set the assertCassettePlayed method to make it assert
+# while recording new test cassettes, set DD_ASSERT_CASSETTE_PLAYED=0 to skip asserting
 # that all entries in the cassette have been used by the test.
 
 # if you need some credentials for the Defect Dojo JIRA Cloud instance, contact one of the moderators
@@ -45,93 +56,124 @@ logger = logging.getLogger(__name__)
 class JIRAImportAndPushTestApi(DojoVCRAPITestCase):
     fixtures = ["dojo_testdata.json"]
 
-    def __init__(self, *args, **kwargs):
-        # TODO: remove __init__ if it does nothing...
-        DojoVCRAPITestCase.__init__(self, *args, **kwargs)
+    zap_sample5_filename = get_unit_tests_scans_path("zap") / "5_zap_sample_one.xml"
+    npm_groups_sample_filename = get_unit_tests_scans_path("npm_audit") / "many_vuln_with_groups.json"
+    npm_groups_sample_filename2 = get_unit_tests_scans_path("npm_audit") / "many_vuln_with_groups_different_titles.json"
+    clair_few_findings = get_unit_tests_scans_path("clair") / "clair_few_vuln.json"
+
+    zap_import_params = {"filename": zap_sample5_filename, "verified": True}
+    npm_groups_import_params = {"filename": npm_groups_sample_filename, "scan_type": "NPM Audit Scan", "group_by": "component_name+component_version", "verified": True}
+
+    # set to False in tests that don't use all of their cassette
+    check_cassette_played = True
+
+    cassette_library_dir = str(get_unit_tests_path() / "vcr" / "jira")
+    # the vcr config that is the same for every test, only the cassette and the recording callbacks differ per test
+    vcr_config = {
+        "record_mode": os.environ.get("DD_VCR_RECORD_MODE", "once"),
+        "path_transformer": VCR.ensure_suffix(".yaml"),
+        "filter_headers": ["Authorization", "X-Atlassian-Token"],
+        # scheme, host and port don't tell the recorded requests apart: jira and the webhook endpoint never
+        # share a path. the query is needed though, createmeta is requested for both Task and Epic.
+        # re-check this when recording cassettes against other hosts
+        "match_on": ("method", "path", "query"),
+        "cassette_library_dir": cassette_library_dir,
+    }
+
+    # only these response headers are recorded, the others are cdn and tracing noise or identify the jira account
+    recorded_response_headers = {"connection", "content-encoding", "content-length", "content-type", "location", "transfer-encoding"}
 
     def assert_cassette_played(self):
-        if True:  # set to True when committing. set to False when recording new test cassettes
+        if os.environ.get("DD_ASSERT_CASSETTE_PLAYED", "1") == "1":
             self.assertTrue(self.cassette.all_played)
 
     def _get_vcr(self, **kwargs):
-        my_vcr = super()._get_vcr(**kwargs)
-        my_vcr.record_mode = "once"
-        my_vcr.path_transformer = VCR.ensure_suffix(".yaml")
-        my_vcr.filter_headers = ["Authorization", "X-Atlassian-Token"]
-        my_vcr.cassette_library_dir = str(get_unit_tests_path() / "vcr" / "jira")
-        # filters headers doesn't seem to work for cookies, so use callbacks to filter cookies from being recorded
-        my_vcr.before_record_request = self.before_record_request
-        my_vcr.before_record_response = self.before_record_response
-        return my_vcr
+        return super()._get_vcr(
+            **self.vcr_config,
+            # filters headers doesn't seem to work for cookies, so use callbacks to filter cookies from being recorded.
+            # they are bound to the running test, so the vcr is built per test
+            before_record_request=self.before_record_request,
+            before_record_response=self.before_record_response,
+            **kwargs,
+        )
+
+    def before_record_response(self, response):
+        response = super().before_record_response(response)
+        response["headers"] = {name: value for name, value in response["headers"].items() if name.lower() in self.recorded_response_headers}
+        return response
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.testuser = User.objects.get(username="admin")
+        UserContactInfo.objects.filter(user=cls.testuser).update(block_execution=True)
+        cls.token = Token.objects.get(user=cls.testuser)
+        System_Settings.objects.update(enable_jira=True)
+        # engagement 3 has its own jira project, used by the epic tests. setUpTestData gives every test its own copy
+        cls.engagement_3 = Engagement.objects.select_related("jira_project").get(id=3)
 
     def setUp(self):
         super().setUp()
-        self.system_settings(enable_jira=True)
-        self.testuser = User.objects.get(username="admin")
-        self.testuser.usercontactinfo.block_execution = True
-        self.testuser.usercontactinfo.save()
-
-        token = Token.objects.get(user=self.testuser)
         self.client = APIClient()
-        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
-        self.zap_sample5_filename = get_unit_tests_scans_path("zap") / "5_zap_sample_one.xml"
-        self.npm_groups_sample_filename = get_unit_tests_scans_path("npm_audit") / "many_vuln_with_groups.json"
-        self.npm_groups_sample_filename2 = get_unit_tests_scans_path("npm_audit") / "many_vuln_with_groups_different_titles.json"
-        self.clair_few_findings = get_unit_tests_scans_path("clair") / "clair_few_vuln.json"
-        self.client.force_login(self.get_test_admin())
-
-    def test_import_no_push_to_jira(self):
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, verified=True)
-        test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        self.client.force_login(self.testuser)
 
-    def test_import_with_push_to_jira_is_false(self):
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=False, verified=True)
-        test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+    def tearDown(self):
+        # by asserting full cassette is played we know all calls to JIRA have been made as expected
+        if self.check_cassette_played:
+            self.assert_cassette_played()
+        super().tearDown()
+
+    def import_zap_scan(self, **kwargs):
+        return self.import_scan_with_params(**{**self.zap_import_params, **kwargs})
+
+    def import_npm_groups_scan(self, **kwargs):
+        return self.import_scan_with_params(**{**self.npm_groups_import_params, **kwargs})
+
+    def test_zap_import_matrix(self):
+        # every combination runs in its own savepoint that is rolled back afterwards,
+        # so its imports aren't deduplicated against those of the previous combinations
+        for push_all_issues, import_kwargs, expected_jira_issue_count in [
+            (False, {}, 0),
+            (False, {"push_to_jira": False}, 0),
+            (True, {}, 2),
+            (True, {"push_to_jira": False}, 2),
+        ]:
+            with self.subTest(push_all_issues=push_all_issues, **import_kwargs), transaction.atomic():
+                if push_all_issues:
+                    self.set_jira_push_all_issues(self.get_engagement(1))
+                import0 = self.import_zap_scan(**import_kwargs)
+                test_id = import0["test"]
+                self.assert_jira_issue_counts_in_test(test_id, expected_jira_issue_count, 0)
+                transaction.set_rollback(True)
 
     def test_import_with_push_to_jira(self):
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=True, verified=True)
+        import0 = self.import_zap_scan(push_to_jira=True)
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
-        # by asserting full cassette is played we know issues have been updated in JIRA
-        self.assert_cassette_played()
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
 
     def test_import_with_groups_push_to_jira(self):
         # 7 findings, 5 unique component_name+component_version
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", push_to_jira=True, verified=True)
+        import0 = self.import_npm_groups_scan(push_to_jira=True)
         test_id = import0["test"]
         # all findings should be in a group, so no JIRA issues for individual findings
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 3)
-        # by asserting full cassette is played we know issues have been updated in JIRA
-        self.assert_cassette_played()
+        self.assert_jira_issue_counts_in_test(test_id, 0, 3)
 
     @with_system_setting("jira_minimum_severity", "Critical")
     def test_import_with_groups_push_to_jira_minimum_critical(self):
         # No Critical findings in report, so expect no groups to be pushed
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", push_to_jira=True, verified=True)
+        import0 = self.import_npm_groups_scan(push_to_jira=True)
         test_id = import0["test"]
         # all findings should be in a group, so no JIRA issues for individual findings
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
-        # by asserting full cassette is played we know issues have been updated in JIRA
-        self.assert_cassette_played()
+        self.assert_jira_issue_counts_in_test(test_id, 0, 0)
 
     @with_system_setting("jira_minimum_severity", "High")
     def test_import_with_groups_push_to_jira_minimum_high(self):
         # 7 findings, 5 unique component_name+component_version
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", push_to_jira=True, verified=True)
+        import0 = self.import_npm_groups_scan(push_to_jira=True)
         test_id = import0["test"]
         # all findings should be in a group, so no JIRA issues for individual findings
-        self.assert_jira_issue_count_in_test(test_id, 0)
         # fresh library has only medium findings, so only 2 instead of 3 groups expected
-        self.assert_jira_group_issue_count_in_test(test_id, 2)
-        # by asserting full cassette is played we know issues have been updated in JIRA
-        self.assert_cassette_played()
+        self.assert_jira_issue_counts_in_test(test_id, 0, 2)
 
     def test_import_with_push_to_jira_epic_as_issue_type(self):
         jira_instance = JIRA_Instance.objects.get(id=2)
@@ -139,177 +181,119 @@ class JIRAImportAndPushTestApi(DojoVCRAPITestCase):
         # if yes, it means we have successfully populated the Epic Name custom field which is mandatory in JIRA
         jira_instance.default_issue_type = "Epic"
         jira_instance.save()
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=True, verified=True)
+        import0 = self.import_zap_scan(push_to_jira=True)
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
-        # by asserting full cassette is played we know issues have been updated in JIRA
-        self.assert_cassette_played()
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
 
-    def test_import_no_push_to_jira_but_push_all(self):
-        self.set_jira_push_all_issues(self.get_engagement(1))
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, verified=True)
-        test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
-        # by asserting full cassette is played we know issues have been updated in JIRA
-        self.assert_cassette_played()
-
-    def test_import_with_groups_no_push_to_jira_but_push_all(self):
-        self.set_jira_push_all_issues(self.get_engagement(1))
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", verified=True)
-        test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 3)
-        # by asserting full cassette is played we know issues have been updated in JIRA
-        self.assert_cassette_played()
-
-    def test_import_with_push_to_jira_is_false_but_push_all(self):
-        self.set_jira_push_all_issues(self.get_engagement(1))
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=False, verified=True)
-        test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
-        # by asserting full cassette is played we know issues have been updated in JIRA
-        self.assert_cassette_played()
-
-    def test_import_with_groups_with_push_to_jira_is_false_but_push_all(self):
-        self.set_jira_push_all_issues(self.get_engagement(1))
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", push_to_jira=False, verified=True)
-        test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 3)
-        # by asserting full cassette is played we know issues have been updated in JIRA
-        self.assert_cassette_played()
+    def test_npm_groups_import_matrix(self):
+        # every combination runs in its own savepoint that is rolled back afterwards,
+        # so its imports aren't deduplicated against those of the previous combinations
+        for import_kwargs in [{}, {"push_to_jira": False}]:
+            with self.subTest(**import_kwargs), transaction.atomic():
+                self.set_jira_push_all_issues(self.get_engagement(1))
+                import0 = self.import_npm_groups_scan(**import_kwargs)
+                test_id = import0["test"]
+                self.assert_jira_issue_counts_in_test(test_id, 0, 3)
+                transaction.set_rollback(True)
 
     def test_import_no_push_to_jira_reimport_no_push_to_jira(self):
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, verified=True)
+        self.check_cassette_played = False
+        import0 = self.import_zap_scan()
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 0, 0)
 
         self.reimport_scan_with_params(test_id, self.zap_sample5_filename, verified=True)
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 0, 0)
 
     def test_import_no_push_to_jira_reimport_push_to_jira_false(self):
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, verified=True)
+        self.check_cassette_played = False
+        import0 = self.import_zap_scan()
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 0, 0)
 
         self.reimport_scan_with_params(test_id, self.zap_sample5_filename, push_to_jira=False, verified=True)
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 0, 0)
 
     def test_import_no_push_to_jira_reimport_with_push_to_jira(self):
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, verified=True)
+        import0 = self.import_zap_scan()
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 0, 0)
 
         self.reimport_scan_with_params(test_id, self.zap_sample5_filename, push_to_jira=True, verified=True)
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
-        # by asserting full cassette is played we know issues have been updated in JIRA
-        self.assert_cassette_played()
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
 
     def test_import_with_groups_no_push_to_jira_reimport_with_push_to_jira(self):
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", verified=True)
+        import0 = self.import_npm_groups_scan()
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 0, 0)
 
         self.reimport_scan_with_params(test_id, self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", push_to_jira=True, verified=True)
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 3)
-        # by asserting full cassette is played we know issues have been updated in JIRA
-        self.assert_cassette_played()
+        self.assert_jira_issue_counts_in_test(test_id, 0, 3)
 
     def test_import_no_push_to_jira_reimport_no_push_to_jira_but_push_all_issues(self):
         self.set_jira_push_all_issues(self.get_engagement(1))
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, verified=True)
+        import0 = self.import_zap_scan()
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
 
         self.reimport_scan_with_params(test_id, self.zap_sample5_filename, verified=True)
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
-        # by asserting full cassette is played we know issues have been updated in JIRA
-        self.assert_cassette_played()
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
 
     def test_import_with_groups_no_push_to_jira_reimport_no_push_to_jira_but_push_all_issues(self):
         self.set_jira_push_all_issues(self.get_engagement(1))
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", verified=True)
+        import0 = self.import_npm_groups_scan()
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 3)
+        self.assert_jira_issue_counts_in_test(test_id, 0, 3)
 
         self.reimport_scan_with_params(test_id, self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", verified=True)
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 3)
-        # by asserting full cassette is played we know issues have been updated in JIRA
-        self.assert_cassette_played()
+        self.assert_jira_issue_counts_in_test(test_id, 0, 3)
 
     def test_import_no_push_to_jira_reimport_push_to_jira_is_false_but_push_all_issues(self):
         self.set_jira_push_all_issues(self.get_engagement(1))
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, verified=True)
+        import0 = self.import_zap_scan()
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
         self.get_jira_issue_updated_map(test_id)
 
         self.reimport_scan_with_params(test_id, self.zap_sample5_filename, push_to_jira=False, verified=True)
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
         # when sending in identical data to JIRA, JIRA does NOT update the updated timestamp....
         # self.assert_jira_updated_map_changed(test_id, updated_map)
-        # by asserting full cassette is played we know issues have been updated in JIRA
-        self.assert_cassette_played()
 
     def test_import_with_groups_no_push_to_jira_reimport_push_to_jira_is_false_but_push_all_issues(self):
         self.set_jira_push_all_issues(self.get_engagement(1))
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", verified=True)
+        import0 = self.import_npm_groups_scan()
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 3)
+        self.assert_jira_issue_counts_in_test(test_id, 0, 3)
         updated_map = self.get_jira_issue_updated_map(test_id)
 
         self.reimport_scan_with_params(test_id, self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", push_to_jira=False, verified=True)
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 3)
+        self.assert_jira_issue_counts_in_test(test_id, 0, 3)
         # when sending in identical data to JIRA, JIRA does NOT update the updated timestamp....
         # self.assert_jira_updated_map_changed(test_id, updated_map)
         self.assert_jira_updated_map_unchanged(test_id, updated_map)
-        # by asserting full cassette is played we know issues have been updated in JIRA
-        self.assert_cassette_played()
 
     def test_import_push_to_jira_reimport_with_push_to_jira(self):
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=True, verified=True)
+        import0 = self.import_zap_scan(push_to_jira=True)
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
         # Get one of the findings from the test
-        finding_id = Finding.objects.filter(test__id=test_id).first().id
+        finding_id = Finding.objects.filter(test_id=test_id).values_list("id", flat=True).first()
         self.get_jira_issue_updated(finding_id)
         # re-import and see status change
         self.reimport_scan_with_params(test_id, self.zap_sample5_filename, push_to_jira=True, verified=True)
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
         self.get_jira_issue_updated(finding_id)
         # when sending in identical data to JIRA, JIRA does NOT update the updated timestamp....
         # self.assert_jira_updated_change(pre_jira_status, post_jira_status)
-        # by asserting full cassette is played we know issues have been updated in JIRA
-        self.assert_cassette_played()
 
     def test_import_twice_push_to_jira(self):
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=True, verified=True)
+        self.check_cassette_played = False
+        import0 = self.import_zap_scan(push_to_jira=True)
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
 
-        import1 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=True, verified=True)
+        import1 = self.import_zap_scan(push_to_jira=True)
         test_id1 = import1["test"]
         # duplicates shouldn't be sent to JIRA
         self.assert_jira_issue_count_in_test(test_id1, 0)
@@ -326,16 +310,15 @@ class JIRAImportAndPushTestApi(DojoVCRAPITestCase):
         # import scan, make sure they are in grouped JIRA
         # risk acceptance all the grouped findings, make sure they are closed in JIRA
         # expire risk acceptance on all grouped findings, make sure they are open in JIRA
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", push_to_jira=True, verified=True)
+        import0 = self.import_npm_groups_scan(push_to_jira=True)
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 3)
-        findings = self.get_test_findings_api(test_id)
-        finding_id = findings["results"][0]["id"]
+        self.assert_jira_issue_counts_in_test(test_id, 0, 3)
+        finding_ids = self.get_test_finding_ids(test_id)
+        finding_id = finding_ids[0]
 
         ra_data = {
             "name": "Accept: Unit test",
-            "accepted_findings": [],
+            "accepted_findings": finding_ids,
             "recommendation": "A",
             "recommendation_details": "recommendation 1",
             "decision": "A",
@@ -346,9 +329,6 @@ class JIRAImportAndPushTestApi(DojoVCRAPITestCase):
             "reactivate_expired": True,
             }
 
-        for finding in findings["results"]:
-            ra_data["accepted_findings"].append(finding["id"])
-
         pre_jira_status = self.get_jira_issue_status(finding_id)
 
         response = self.add_risk_acceptance(1, data_risk_accceptance=ra_data)
@@ -362,7 +342,7 @@ class JIRAImportAndPushTestApi(DojoVCRAPITestCase):
         self.assertNotEqual(pre_jira_status, post_jira_status)
 
         pre_jira_status = post_jira_status
-        ra = Risk_Acceptance.objects.last()
+        ra = Risk_Acceptance.objects.filter(engagement__id=1).order_by("-id").first()
         ra_helper.expire_now(ra)
         # We do this to update the JIRA
         for finding in ra_data["accepted_findings"]:
@@ -371,43 +351,35 @@ class JIRAImportAndPushTestApi(DojoVCRAPITestCase):
         post_jira_status = self.get_jira_issue_status(finding_id)
         self.assertNotEqual(pre_jira_status, post_jira_status)
 
-        # by asserting full cassette is played we know all calls to JIRA have been made as expected
-        self.assert_cassette_played()
-
     def test_import_with_groups_twice_push_to_jira(self):
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", push_to_jira=True, verified=True)
+        self.check_cassette_played = False
+        import0 = self.import_npm_groups_scan(push_to_jira=True)
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 3)
+        self.assert_jira_issue_counts_in_test(test_id, 0, 3)
 
-        import1 = self.import_scan_with_params(self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", push_to_jira=True, verified=True)
+        import1 = self.import_npm_groups_scan(push_to_jira=True)
         test_id1 = import1["test"]
         # duplicates shouldn't be sent to JIRA
-        self.assert_jira_issue_count_in_test(test_id1, 0)
-        self.assert_jira_group_issue_count_in_test(test_id1, 0)
+        self.assert_jira_issue_counts_in_test(test_id1, 0, 0)
 
     def test_import_twice_push_to_jira_push_all_issues(self):
+        self.check_cassette_played = False
         self.set_jira_push_all_issues(self.get_engagement(1))
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, verified=True)
+        import0 = self.import_zap_scan()
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
 
-        import1 = self.import_scan_with_params(self.zap_sample5_filename, verified=True)
+        import1 = self.import_zap_scan()
         test_id1 = import1["test"]
         # duplicates shouldn't be sent to JIRA
-        self.assert_jira_issue_count_in_test(test_id1, 0)
-        self.assert_jira_group_issue_count_in_test(test_id1, 0)
+        self.assert_jira_issue_counts_in_test(test_id1, 0, 0)
 
     def test_create_edit_update_finding(self):
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, verified=True)
+        import0 = self.import_zap_scan()
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 0, 0)
 
-        findings = self.get_test_findings_api(test_id)
-
-        finding_id = findings["results"][0]["id"]
+        finding_id = self.get_test_finding_ids(test_id)[0]
 
         # use existing finding as template, but change some fields to make it not a duplicate
         finding_details = self.get_finding_api(finding_id)
@@ -417,30 +389,25 @@ class JIRAImportAndPushTestApi(DojoVCRAPITestCase):
         with self.subTest("New finding, no push to jira should not create a new issue"):
             finding_details["title"] = "jira api test 1"
             self.post_new_finding_api(finding_details)
-            self.assert_jira_issue_count_in_test(test_id, 0)
-            self.assert_jira_group_issue_count_in_test(test_id, 0)
+            self.assert_jira_issue_counts_in_test(test_id, 0, 0)
 
         with self.subTest("New finding, push to jira should create a new issue"):
             finding_details["title"] = "jira api test 2"
             self.post_new_finding_api(finding_details, push_to_jira=True)
-            self.assert_jira_issue_count_in_test(test_id, 1)
-            self.assert_jira_group_issue_count_in_test(test_id, 0)
+            self.assert_jira_issue_counts_in_test(test_id, 1, 0)
 
         with self.subTest("New finding, no push to jira should not create a new issue"):
             finding_details["title"] = "jira api test 3"
             new_finding_json = self.post_new_finding_api(finding_details)
-            self.assert_jira_issue_count_in_test(test_id, 1)
-            self.assert_jira_group_issue_count_in_test(test_id, 0)
+            self.assert_jira_issue_counts_in_test(test_id, 1, 0)
 
         with self.subTest("Updating this new finding without push to jira should not create a new issue"):
             self.patch_finding_api(new_finding_json["id"], {"push_to_jira": False})
-            self.assert_jira_issue_count_in_test(test_id, 1)
-            self.assert_jira_group_issue_count_in_test(test_id, 0)
+            self.assert_jira_issue_counts_in_test(test_id, 1, 0)
 
         with self.subTest("Updating this new finding with push to jira should create a new issue"):
             self.patch_finding_api(new_finding_json["id"], {"push_to_jira": True})
-            self.assert_jira_issue_count_in_test(test_id, 2)
-            self.assert_jira_group_issue_count_in_test(test_id, 0)
+            self.assert_jira_issue_counts_in_test(test_id, 2, 0)
 
         # Only Finding Groups will have their priority synced on updates.
         # For Findings we resepect any priority change made in JIRA
@@ -448,8 +415,7 @@ class JIRAImportAndPushTestApi(DojoVCRAPITestCase):
         with self.subTest("Changing priority of a finding should NOT be reflected in JIRA"):
             pre_jira_priority = self.get_jira_issue_priority(new_finding_json["id"])
             self.patch_finding_api(new_finding_json["id"], {"severity": "Medium"})
-            self.assert_jira_issue_count_in_test(test_id, 2)
-            self.assert_jira_group_issue_count_in_test(test_id, 0)
+            self.assert_jira_issue_counts_in_test(test_id, 2, 0)
             post_jira_priority = self.get_jira_issue_priority(new_finding_json["id"])
             self.assertEqual(pre_jira_priority, post_jira_priority)
 
@@ -460,8 +426,7 @@ class JIRAImportAndPushTestApi(DojoVCRAPITestCase):
             self.patch_finding_api(new_finding_json["id"], {"push_to_jira": True,
                                                             "is_mitigated": True,
                                                             "active": False})
-            self.assert_jira_issue_count_in_test(test_id, 2)
-            self.assert_jira_group_issue_count_in_test(test_id, 0)
+            self.assert_jira_issue_counts_in_test(test_id, 2, 0)
             post_jira_status = self.get_jira_issue_status(new_finding_json["id"])
             self.assertEqual("Done", post_jira_status.name)
 
@@ -470,25 +435,18 @@ class JIRAImportAndPushTestApi(DojoVCRAPITestCase):
         new_finding_id = new_finding_json["id"]
         del new_finding_json["id"]
 
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
         self.put_finding_api(new_finding_id, new_finding_json, push_to_jira=False)
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
         self.put_finding_api(new_finding_id, new_finding_json, push_to_jira=True)
-        self.assert_jira_issue_count_in_test(test_id, 3)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 3, 0)
         self.put_finding_api(new_finding_id, new_finding_json, push_to_jira=True)
-        self.assert_jira_issue_count_in_test(test_id, 3)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
-
-        self.assert_cassette_played()
+        self.assert_jira_issue_counts_in_test(test_id, 3, 0)
 
     def test_groups_create_edit_update_finding(self):
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", verified=True)
+        import0 = self.import_npm_groups_scan()
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 0)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 0, 0)
 
         findings = self.get_test_findings_api(test_id, component_name="negotiator")
 
@@ -504,8 +462,7 @@ class JIRAImportAndPushTestApi(DojoVCRAPITestCase):
             # push a finding should result in pushing the group instead
             self.patch_finding_api(findings["results"][0]["id"], {"push_to_jira": True, "verified": True})
 
-            self.assert_jira_issue_count_in_test(test_id, 0)
-            self.assert_jira_group_issue_count_in_test(test_id, 1)
+            self.assert_jira_issue_counts_in_test(test_id, 0, 1)
 
             post_jira_status = self.get_jira_issue_status(findings["results"][0]["id"])
             self.assertEqual("Backlog", post_jira_status.name)
@@ -513,8 +470,7 @@ class JIRAImportAndPushTestApi(DojoVCRAPITestCase):
         with self.subTest("Pushing a different finding with in a group should result in the group issue being pushed and not a new issue being created"):
             # push second finding from the same group should not result in a new jira issue
             self.patch_finding_api(findings["results"][1]["id"], {"push_to_jira": True})
-            self.assert_jira_issue_count_in_test(test_id, 0)
-            self.assert_jira_group_issue_count_in_test(test_id, 1)
+            self.assert_jira_issue_counts_in_test(test_id, 0, 1)
 
             post_jira_status = self.get_jira_issue_status(findings["results"][0]["id"])
             self.assertEqual("Backlog", post_jira_status.name)
@@ -539,45 +495,38 @@ class JIRAImportAndPushTestApi(DojoVCRAPITestCase):
             self.assertEqual("High", post_jira_priority.name)
 
         with self.subTest("Closing all findings in the group should result in the group issue being closed and priority being updated"):
-            pre_jira_status = self.get_jira_issue_status(findings["results"][0]["id"])
-            pre_jira_priority = self.get_jira_issue_priority(findings["results"][0]["id"])
-            self.assertEqual("High", pre_jira_priority.name)
-            self.assertEqual("Backlog", pre_jira_status.name)
+            pre_jira_issue = self.get_jira_issue(findings["results"][0]["id"])
+            self.assertEqual("High", pre_jira_issue.fields.priority.name)
+            self.assertEqual("Backlog", pre_jira_issue.fields.status.name)
 
             # close both findings
             self.patch_finding_api(findings["results"][0]["id"], {"active": False, "is_mitigated": True, "push_to_jira": True})
             self.patch_finding_api(findings["results"][1]["id"], {"active": False, "is_mitigated": True, "push_to_jira": True})
 
-            post_jira_status = self.get_jira_issue_status(findings["results"][0]["id"])
-            post_jira_priority = self.get_jira_issue_priority(findings["results"][0]["id"])
-            self.assertEqual("Lowest", post_jira_priority.name)
-            self.assertEqual("Done", post_jira_status.name)
+            post_jira_issue = self.get_jira_issue(findings["results"][0]["id"])
+            self.assertEqual("Lowest", post_jira_issue.fields.priority.name)
+            self.assertEqual("Done", post_jira_issue.fields.status.name)
 
         with self.subTest("Updating group findings to have no active findings above threshold should result in the group issue being set to the lowest priority and remain inactive"):
             # reopen 1 finding, but make it below the threshold
             self.patch_finding_api(findings["results"][0]["id"], {"active": True, "is_mitigated": False, "severity": "Info", "push_to_jira": True})
 
-            post_jira_status = self.get_jira_issue_status(findings["results"][0]["id"])
-            post_jira_priority = self.get_jira_issue_priority(findings["results"][0]["id"])
-            self.assertEqual("Lowest", post_jira_priority.name)
-            self.assertEqual("Done", post_jira_status.name)
+            post_jira_issue = self.get_jira_issue(findings["results"][0]["id"])
+            self.assertEqual("Lowest", post_jira_issue.fields.priority.name)
+            self.assertEqual("Done", post_jira_issue.fields.status.name)
 
             # reopen the other finding
             self.patch_finding_api(findings["results"][1]["id"], {"active": True, "is_mitigated": False, "severity": "Medium", "push_to_jira": True})
-            post_jira_status = self.get_jira_issue_status(findings["results"][1]["id"])
-            post_jira_priority = self.get_jira_issue_priority(findings["results"][1]["id"])
-            self.assertEqual("Medium", post_jira_priority.name)
-            self.assertEqual("Backlog", post_jira_status.name)
+            post_jira_issue = self.get_jira_issue(findings["results"][1]["id"])
+            self.assertEqual("Medium", post_jira_issue.fields.priority.name)
+            self.assertEqual("Backlog", post_jira_issue.fields.status.name)
 
         with self.subTest("Opening a finding without push_to_jira should not result in a new issue being created"):
             # new finding, not pushed to JIRA
-            # use existing finding as template, but change some fields to make it not a duplicate
-            self.get_finding_api(findings["results"][0]["id"])
-
+            # reuse the finding details read above as template, but change some fields to make it not a duplicate
             finding_details["title"] = "jira api test 1"
             self.post_new_finding_api(finding_details)
-            self.assert_jira_issue_count_in_test(test_id, 0)
-            self.assert_jira_group_issue_count_in_test(test_id, 1)
+            self.assert_jira_issue_counts_in_test(test_id, 0, 1)
 
         with self.subTest("Opening a finding in the same group without push_to_jira should not result in a new issue being created"):
             # another new finding, pushed to JIRA
@@ -585,88 +534,68 @@ class JIRAImportAndPushTestApi(DojoVCRAPITestCase):
 
             finding_details["title"] = "jira api test 2"
             new_finding_json = self.post_new_finding_api(finding_details, push_to_jira=True)
-            self.assert_jira_issue_count_in_test(test_id, 1)
-            self.assert_jira_group_issue_count_in_test(test_id, 1)
+            self.assert_jira_issue_counts_in_test(test_id, 1, 1)
 
             # no way to set finding group easily via API yet
-            Finding_Group.objects.get(id=finding_group_id).findings.add(Finding.objects.get(id=new_finding_json["id"]))
+            Finding_Group.objects.only("id").get(id=finding_group_id).findings.add(new_finding_json["id"])
 
             self.patch_finding_api(new_finding_json["id"], {"push_to_jira": True})
 
-            self.assert_jira_issue_count_in_test(test_id, 1)
-            self.assert_jira_group_issue_count_in_test(test_id, 1)
+            self.assert_jira_issue_counts_in_test(test_id, 1, 1)
 
         with self.subTest("Opening a finding with different fields resulting in a diffrent group should result in a new group issue being created"):
             # another new finding, pushed to JIRA, different component_name / different group
             finding_details["title"] = "jira api test 3"
             finding_details["component_name"] = "pg"
             new_finding_json = self.post_new_finding_api(finding_details)
-            self.assert_jira_issue_count_in_test(test_id, 1)
-            self.assert_jira_group_issue_count_in_test(test_id, 1)
+            self.assert_jira_issue_counts_in_test(test_id, 1, 1)
 
             findings = self.get_test_findings_api(test_id, component_name="pg")
 
             finding_group_id = findings["results"][0]["finding_groups"][0]["id"]
 
             # no way to set finding group easily via API yet
-            Finding_Group.objects.get(id=finding_group_id).findings.add(Finding.objects.get(id=new_finding_json["id"]))
+            Finding_Group.objects.only("id").get(id=finding_group_id).findings.add(new_finding_json["id"])
 
             self.patch_finding_api(new_finding_json["id"], {"push_to_jira": True})
 
-            self.assert_jira_issue_count_in_test(test_id, 1)
-            self.assert_jira_group_issue_count_in_test(test_id, 2)
-
-        self.assert_cassette_played()
+            self.assert_jira_issue_counts_in_test(test_id, 1, 2)
 
     def test_import_with_push_to_jira_add_comment(self):
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=True, verified=True)
+        import0 = self.import_zap_scan(push_to_jira=True)
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
-
-        findings = self.get_test_findings_api(test_id)
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
 
-        finding_id = findings["results"][0]["id"]
+        finding_id = self.get_test_finding_ids(test_id)[0]
 
         self.post_finding_notes_api(finding_id, "testing note. creating it and pushing it to JIRA")
         self.patch_finding_api(finding_id, {"push_to_jira": True})
         # Make sure the number of comments match
         self.assertEqual(len(self.get_jira_comments(finding_id)), 1)
-        # by asserting full cassette is played we know all calls to JIRA have been made as expected
-        self.assert_cassette_played()
 
     def test_import_add_comments_then_push_to_jira(self):
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=False, verified=True)
+        import0 = self.import_zap_scan(push_to_jira=False)
         test_id = import0["test"]
 
-        findings = self.get_test_findings_api(test_id)
-
-        finding_id = findings["results"][0]["id"]
+        finding_id = self.get_test_finding_ids(test_id)[0]
 
         self.post_finding_notes_api(finding_id, "testing note. creating it and pushing it to JIRA")
         self.post_finding_notes_api(finding_id, "testing second note. creating it and pushing it to JIRA")
         self.patch_finding_api(finding_id, {"push_to_jira": True})
 
-        self.assert_jira_issue_count_in_test(test_id, 1)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 1, 0)
         # Make sure the number of comments match
         self.assertEqual(len(self.get_jira_comments(finding_id)), 2)
-        # by asserting full cassette is played we know all calls to JIRA have been made as expected
-        self.assert_cassette_played()
 
     def test_import_with_push_to_jira_add_tags(self):
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=True, verified=True)
+        import0 = self.import_zap_scan(push_to_jira=True)
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
 
-        findings = self.get_test_findings_api(test_id)
-
-        finding = Finding.objects.get(id=findings["results"][0]["id"])
+        finding = Finding.objects.filter(test_id=test_id).select_related("jira_issue").order_by("id").first()
 
         tags = ["tag1", "tag2"]
-        self.post_finding_tags_api(finding.id, tags)
-        self.patch_finding_api(finding.id, {"push_to_jira": True})
+        self.patch_finding_api(finding.id, {"tags": tags, "push_to_jira": True})
 
         # Connect to jira to get the new issue
         jira_instance = jira_helper.get_jira_instance(finding)
@@ -676,22 +605,15 @@ class JIRAImportAndPushTestApi(DojoVCRAPITestCase):
         # Assert that the tags match
         self.assertEqual(issue.fields.labels, tags)
 
-        # by asserting full cassette is played we know all calls to JIRA have been made as expected
-        self.assert_cassette_played()
-
     def test_import_with_push_to_jira_update_tags(self):
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=True, verified=True)
+        import0 = self.import_zap_scan(push_to_jira=True)
         test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
 
-        findings = self.get_test_findings_api(test_id)
-
-        finding = Finding.objects.get(id=findings["results"][0]["id"])
+        finding = Finding.objects.filter(test_id=test_id).select_related("jira_issue").order_by("id").first()
 
         tags = ["tag1", "tag2"]
-        self.post_finding_tags_api(finding.id, tags)
-        self.patch_finding_api(finding.id, {"push_to_jira": True})
+        self.patch_finding_api(finding.id, {"tags": tags, "push_to_jira": True})
 
         # Connect to jira to get the new issue
         jira_instance = jira_helper.get_jira_instance(finding)
@@ -702,216 +624,122 @@ class JIRAImportAndPushTestApi(DojoVCRAPITestCase):
         self.assertEqual(issue.fields.labels, tags)
 
         tags_new = [*tags, "tag3", "tag4"]
-        self.post_finding_tags_api(finding.id, tags_new)
-        self.patch_finding_api(finding.id, {"push_to_jira": True})
+        self.patch_finding_api(finding.id, {"tags": tags_new, "push_to_jira": True})
 
-        # Connect to jira to get the new issue
-        jira_instance = jira_helper.get_jira_instance(finding)
-        jira = jira_helper.get_jira_connection(jira_instance)
+        # Reuse the jira connection to get the updated issue
         issue = jira.issue(finding.jira_issue.jira_id)
 
         # Assert that the tags match
         self.assertEqual(issue.fields.labels, tags_new)
 
-        # by asserting full cassette is played we know all calls to JIRA have been made as expected
-        self.assert_cassette_played()
-
-    @toggle_system_setting_boolean("enforce_verified_status", True)  # noqa: FBT003
-    @toggle_system_setting_boolean("enforce_verified_status_jira", True)  # noqa: FBT003
-    @with_system_setting("jira_minimum_severity", "Low")
-    def test_import_with_push_to_jira_not_verified_enforced_verified_globally_true_enforced_verified_jira_true(self):
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=True, verified=False)
-        test_id = import0["test"]
-        # This scan file has two active findings, so we should not push either of them
-        self.assert_jira_issue_count_in_test(test_id, 0)
-
-        # Verfied findings should be pushed, different scan to avoid dedupe interference
-        import0 = self.import_scan_with_params(self.clair_few_findings, scan_type="Clair Scan", push_to_jira=True, verified=True)
-        test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 4)
-
-        # by asserting full cassette is played we know all calls to JIRA have been made as expected
-        self.assert_cassette_played()
-
-    @toggle_system_setting_boolean("enforce_verified_status", True)  # noqa: FBT003
-    @toggle_system_setting_boolean("enforce_verified_status_jira", False)  # noqa: FBT003
-    @with_system_setting("jira_minimum_severity", "Low")
-    def test_import_with_push_to_jira_not_verified_enforced_verified_globally_true_enforced_verified_jira_false(self):
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=True, verified=False)
-        test_id = import0["test"]
-        # This scan file has two active findings, so we should not push either of them
-        self.assert_jira_issue_count_in_test(test_id, 0)
-
-        # Verfied findings should be pushed, different scan to avoid dedupe interference
-        import0 = self.import_scan_with_params(self.clair_few_findings, scan_type="Clair Scan", push_to_jira=True, verified=True)
-        test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 4)
-        # by asserting full cassette is played we know all calls to JIRA have been made as expected
-
-        self.assert_cassette_played()
-
-    @toggle_system_setting_boolean("enforce_verified_status", False)  # noqa: FBT003
-    @toggle_system_setting_boolean("enforce_verified_status_jira", True)  # noqa: FBT003
-    @with_system_setting("jira_minimum_severity", "Low")
-    def test_import_with_push_to_jira_not_verified_enforced_verified_globally_false_enforced_verified_jira_true(self):
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=True, verified=False)
-        test_id = import0["test"]
-        # This scan file has two active findings, so we should not push either of them
-        self.assert_jira_issue_count_in_test(test_id, 0)
-
-        # Verfied findings should be pushed, different scan to avoid dedupe interference
-        import0 = self.import_scan_with_params(self.clair_few_findings, scan_type="Clair Scan", push_to_jira=True, verified=True)
-        test_id = import0["test"]
-        self.assert_jira_issue_count_in_test(test_id, 4)
-
-        # by asserting full cassette is played we know all calls to JIRA have been made as expected
-        self.assert_cassette_played()
-
-    @toggle_system_setting_boolean("enforce_verified_status", False)  # noqa: FBT003
-    @toggle_system_setting_boolean("enforce_verified_status_jira", False)  # noqa: FBT003
-    @with_system_setting("jira_minimum_severity", "Low")
-    def test_import_with_push_to_jira_not_verified_enforced_verified_globally_false_enforced_verified_jira_false(self):
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=True, verified=False)
-        test_id = import0["test"]
-        # This scan file has two active findings, so we should not push both of them
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        # by asserting full cassette is played we know all calls to JIRA have been made as expected
-        self.assert_cassette_played()
-
-    @toggle_system_setting_boolean("enforce_verified_status", True)  # noqa: FBT003
-    @toggle_system_setting_boolean("enforce_verified_status_jira", True)  # noqa: FBT003
-    def test_groups_import_with_push_to_jira_not_verified_enforced_verified_globally_true_enforced_verified_jira_true(self):
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", push_to_jira=True, verified=False)
-        test_id = import0["test"]
-        # No verified findings, means no groups pushed to JIRA
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
-
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename2, scan_type="NPM Audit Scan", group_by="component_name+component_version", push_to_jira=True, verified=True)
-        test_id = import0["test"]
-        self.assert_jira_group_issue_count_in_test(test_id, 3)
-
-        # by asserting full cassette is played we know all calls to JIRA have been made as expected
-        self.assert_cassette_played()
-
-    @toggle_system_setting_boolean("enforce_verified_status", True)  # noqa: FBT003
-    @toggle_system_setting_boolean("enforce_verified_status_jira", False)  # noqa: FBT003
-    def test_groups_import_with_push_to_jira_not_verified_enforced_verified_globally_true_enforced_verified_jira_false(self):
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", push_to_jira=True, verified=False)
-        test_id = import0["test"]
-        # No verified findings, means no groups pushed to JIRA
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
-
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename2, scan_type="NPM Audit Scan", group_by="component_name+component_version", push_to_jira=True, verified=True)
-        test_id = import0["test"]
-        self.assert_jira_group_issue_count_in_test(test_id, 3)
-        # by asserting full cassette is played we know all calls to JIRA have been made as expected
-
-        self.assert_cassette_played()
-
-    @toggle_system_setting_boolean("enforce_verified_status", False)  # noqa: FBT003
-    @toggle_system_setting_boolean("enforce_verified_status_jira", True)  # noqa: FBT003
-    def test_groups_import_with_push_to_jira_not_verified_enforced_verified_globally_false_enforced_verified_jira_true(self):
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", push_to_jira=True, verified=False)
-        test_id = import0["test"]
-        # No verified findings, means no groups pushed to JIRA
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
-
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename2, scan_type="NPM Audit Scan", group_by="component_name+component_version", push_to_jira=True, verified=True)
-        test_id = import0["test"]
-        self.assert_jira_group_issue_count_in_test(test_id, 3)
-
-        # by asserting full cassette is played we know all calls to JIRA have been made as expected
-        self.assert_cassette_played()
-
-    @toggle_system_setting_boolean("enforce_verified_status", False)  # noqa: FBT003
-    @toggle_system_setting_boolean("enforce_verified_status_jira", False)  # noqa: FBT003
-    @with_system_setting("jira_minimum_severity", "Low")
-    def test_groups_import_with_push_to_jira_not_verified_enforced_verified_globally_false_enforced_verified_jira_false(self):
-        import0 = self.import_scan_with_params(self.npm_groups_sample_filename, scan_type="NPM Audit Scan", group_by="component_name+component_version", push_to_jira=True, verified=True)
-        test_id = import0["test"]
-        self.assert_jira_group_issue_count_in_test(test_id, 3)
-        # by asserting full cassette is played we know all calls to JIRA have been made as expected
-        self.assert_cassette_played()
+    def test_import_with_push_to_jira_not_verified_enforced_verified(self):
+        # every combination runs in its own savepoint that is rolled back afterwards,
+        # which also restores the system settings and keeps the imports from deduplicating against each other
+        for enforce_verified_status, enforce_verified_status_jira in [(True, True), (True, False), (False, True), (False, False)]:
+            with self.subTest(enforce_verified_status=enforce_verified_status, enforce_verified_status_jira=enforce_verified_status_jira), transaction.atomic():
+                System_Settings.objects.update(enforce_verified_status=enforce_verified_status, enforce_verified_status_jira=enforce_verified_status_jira, jira_minimum_severity="Low")
+                import0 = self.import_zap_scan(push_to_jira=True, verified=False)
+                test_id = import0["test"]
+                if enforce_verified_status or enforce_verified_status_jira:
+                    # This scan file has two active findings, so we should not push either of them
+                    self.assert_jira_issue_count_in_test(test_id, 0)
+
+                    # Verfied findings should be pushed, different scan to avoid dedupe interference
+                    import0 = self.import_scan_with_params(self.clair_few_findings, scan_type="Clair Scan", push_to_jira=True, verified=True)
+                    test_id = import0["test"]
+                    self.assert_jira_issue_count_in_test(test_id, 4)
+                else:
+                    # This scan file has two active findings, so we should push both of them
+                    self.assert_jira_issue_count_in_test(test_id, 2)
+                transaction.set_rollback(True)
+
+    def test_groups_import_with_push_to_jira_not_verified_enforced_verified(self):
+        # every combination runs in its own savepoint that is rolled back afterwards,
+        # which also restores the system settings and keeps the imports from deduplicating against each other
+        for enforce_verified_status, enforce_verified_status_jira in [(True, True), (True, False), (False, True), (False, False)]:
+            with self.subTest(enforce_verified_status=enforce_verified_status, enforce_verified_status_jira=enforce_verified_status_jira), transaction.atomic():
+                System_Settings.objects.update(enforce_verified_status=enforce_verified_status, enforce_verified_status_jira=enforce_verified_status_jira)
+                if enforce_verified_status or enforce_verified_status_jira:
+                    import0 = self.import_npm_groups_scan(push_to_jira=True, verified=False)
+                    test_id = import0["test"]
+                    # No verified findings, means no groups pushed to JIRA
+                    self.assert_jira_group_issue_count_in_test(test_id, 0)
+
+                    import0 = self.import_npm_groups_scan(filename=self.npm_groups_sample_filename2, push_to_jira=True)
+                    test_id = import0["test"]
+                    self.assert_jira_group_issue_count_in_test(test_id, 3)
+                else:
+                    System_Settings.objects.update(jira_minimum_severity="Low")
+                    import0 = self.import_npm_groups_scan(push_to_jira=True)
+                    test_id = import0["test"]
+                    self.assert_jira_group_issue_count_in_test(test_id, 3)
+                transaction.set_rollback(True)
 
     def test_engagement_epic_creation(self):
-        eng = self.get_engagement(3)
+        eng = self.engagement_3
         # Set epic_mapping to true
         self.toggle_jira_project_epic_mapping(eng, value=True)
         self.create_engagement_epic(eng)
         self.assertTrue(eng.has_jira_issue)
 
-        self.assert_cassette_played()
-
     def test_engagement_epic_mapping_enabled_create_epic_and_push_findings(self):
-        eng = self.get_engagement(3)
+        eng = self.engagement_3
         # Set epic_mapping to true
         self.toggle_jira_project_epic_mapping(eng, value=True)
         self.create_engagement_epic(eng)
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=True, engagement=3, verified=True)
+        import0 = self.import_zap_scan(push_to_jira=True, engagement=3)
         test_id = import0["test"]
         # Correct number of issues are pushed to jira
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
         # Correct number of issues are in the epic
         self.assert_epic_issue_count(eng, 2)
         # Ensure issue are actually in the correct epic
-        finding = Finding.objects.filter(test__id=test_id).first()
+        finding = Finding.objects.filter(test_id=test_id).select_related("jira_issue").first()
         self.assert_jira_issue_in_epic(finding, eng, issue_in_epic=True)
 
-        self.assert_cassette_played()
-
     def test_engagement_epic_mapping_enabled_no_epic_and_push_findings(self):
-        eng = self.get_engagement(3)
+        eng = self.engagement_3
         # Set epic_mapping to true
         self.toggle_jira_project_epic_mapping(eng, value=True)
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=True, engagement=3, verified=True)
+        import0 = self.import_zap_scan(push_to_jira=True, engagement=3)
         test_id = import0["test"]
         # Correct number of issues are pushed to jira
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
         # Correct number of issues are in the epic
         self.assert_epic_issue_count(eng, 0)
         # Ensure issue are actually not in the correct epic
-        finding = Finding.objects.filter(test__id=test_id).first()
+        finding = Finding.objects.filter(test_id=test_id).select_related("jira_issue").first()
         self.assert_jira_issue_in_epic(finding, eng, issue_in_epic=False)
 
-        self.assert_cassette_played()
-
     def test_engagement_epic_mapping_disabled_create_epic_and_push_findings(self):
-        eng = self.get_engagement(3)
+        eng = self.engagement_3
         # Set epic_mapping to true
         self.toggle_jira_project_epic_mapping(eng, value=False)
         self.create_engagement_epic(eng)
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=True, engagement=3, verified=True)
+        import0 = self.import_zap_scan(push_to_jira=True, engagement=3)
         test_id = import0["test"]
         # Correct number of issues are pushed to jira
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
         # Correct number of issues are in the epic
         self.assert_epic_issue_count(eng, 0)
         # Ensure issue are actually in the correct epic
-        finding = Finding.objects.filter(test__id=test_id).first()
+        finding = Finding.objects.filter(test_id=test_id).select_related("jira_issue").first()
         self.assert_jira_issue_in_epic(finding, eng, issue_in_epic=False)
 
-        self.assert_cassette_played()
-
     def test_engagement_epic_mapping_disabled_no_epic_and_push_findings(self):
-        eng = self.get_engagement(3)
+        eng = self.engagement_3
         # Set epic_mapping to true
         self.toggle_jira_project_epic_mapping(eng, value=False)
-        import0 = self.import_scan_with_params(self.zap_sample5_filename, push_to_jira=True, engagement=3, verified=True)
+        import0 = self.import_zap_scan(push_to_jira=True, engagement=3)
         test_id = import0["test"]
         # Correct number of issues are pushed to jira
-        self.assert_jira_issue_count_in_test(test_id, 2)
-        self.assert_jira_group_issue_count_in_test(test_id, 0)
+        self.assert_jira_issue_counts_in_test(test_id, 2, 0)
         # Correct number of issues are in the epic
         self.assert_epic_issue_count(eng, 0)
         # Ensure issue are actually not in the correct epic
-        finding = Finding.objects.filter(test__id=test_id).first()
+        finding = Finding.objects.filter(test_id=test_id).select_related("jira_issue").first()
         self.assert_jira_issue_in_epic(finding, eng, issue_in_epic=False)
 
-        self.assert_cassette_played()
-
     # creation of epic via the UI is already tested in test_jira_config_engagement_epic, so
     # we take a shortcut here as creating an engagement with epic mapping via the API is not implemented yet
     def create_engagement_epic(self, engagement):
@@ -52,6 +52,22 @@ class TestCyclonedxParser(DojoTestCase):
                 self.assertEqual(finding.component_name + ":" + finding.component_version + " | " + vulnerability_ids[0],
                                  finding.title)
 
+    def test_spec1_report_vulnerabilities_first(self):
+        """Adhoc vulnerabilities declared before the components they refer to"""
+        # regression guard for the single top-level walk: the former one search per kind of node
+        # always read the components first, so this ordering only matters since the walk was fused
+        with (get_unit_tests_scans_path("cyclonedx") / "spec1_vulnerabilities_first.xml").open(encoding="utf-8") as file:
+            parser = CycloneDXParser()
+            findings = list(parser.get_findings(file, Test()))
+            for finding in findings:
+                self.assertIn(finding.severity, Finding.SEVERITIES)
+            self.assertEqual(1, len(findings))
+            with self.subTest(i=0):
+                finding = findings[0]
+                self.assertEqual("jackson-databind", finding.component_name)
+                self.assertEqual("2.9.9", finding.component_version)
+                self.assertEqual("jackson-databind:2.9.9 | CVE-2018-7489", finding.title)
+
     def test_spec1_report_low_first(self):
         """Test a report from the spec itself"""
         with (get_unit_tests_scans_path("cyclonedx") / "spec1_lowfirst.xml").open(encoding="utf-8") as file:
@@ -335,6 +351,54 @@ class TestCyclonedxParser(DojoTestCase):
                 self.assertEqual("2.13.2", finding.component_version)
                 self.assertEqual("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H", finding.cvssv3)
 
+    def test_spec1_report_multiple_cvssv3_ratings(self):
+        """Legacy vulnerability with several CVSS v3 ratings"""
+        with (get_unit_tests_scans_path("cyclonedx") / "spec1_cvssv3_multiple_ratings.xml").open(encoding="utf-8") as file:
+            parser = CycloneDXParser()
+            findings = list(parser.get_findings(file, Test()))
+            for finding in findings:
+                self.assertIn(finding.severity, Finding.SEVERITIES)
+                finding.clean()
+            self.assertEqual(1, len(findings))
+            with self.subTest(i=0):
+                finding = findings[0]
+                self.assertEqual("jackson-databind:2.9.9 | CVE-2018-7489", finding.title)
+                # the invalid vector is skipped and the first valid CVSS v3 rating wins over the later one
+                self.assertEqual("High", finding.severity)
+                self.assertEqual("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:N/A:N", finding.cvssv3)
+
+    def test_cyclonedx_1_4_xml_multiple_cvssv3_ratings(self):
+        """CycloneDX version 1.4 XML format with several CVSS v3 ratings"""
+        with (get_unit_tests_scans_path("cyclonedx") / "cvssv3_multiple_ratings.xml").open(encoding="utf-8") as file:
+            parser = CycloneDXParser()
+            findings = list(parser.get_findings(file, Test()))
+            for finding in findings:
+                self.assertIn(finding.severity, Finding.SEVERITIES)
+                finding.clean()
+            self.assertEqual(1, len(findings))
+            with self.subTest(i=0):
+                finding = findings[0]
+                self.assertEqual("jackson-databind:2.9.4 | CVE-2018-7489", finding.title)
+                # the invalid vector is skipped and the first valid CVSS v3 rating wins over the later one
+                self.assertEqual("High", finding.severity)
+                self.assertEqual("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:N/A:N", finding.cvssv3)
+
+    def test_cyclonedx_1_4_json_multiple_cvssv3_ratings(self):
+        """CycloneDX version 1.4 JSON format with several CVSS v3 ratings"""
+        with (get_unit_tests_scans_path("cyclonedx") / "cvssv3_multiple_ratings.json").open(encoding="utf-8") as file:
+            parser = CycloneDXParser()
+            findings = list(parser.get_findings(file, Test()))
+            for finding in findings:
+                self.assertIn(finding.severity, Finding.SEVERITIES)
+                finding.clean()
+            self.assertEqual(1, len(findings))
+            with self.subTest(i=0):
+                finding = findings[0]
+                self.assertEqual("jackson-databind:2.9.4 | CVE-2018-7489", finding.title)
+                # the invalid vector is skipped and the first valid CVSS v3 rating wins over the later one
+                self.assertEqual("High", finding.severity)
+                self.assertEqual("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:N/A:N", finding.cvssv3)
+
     def test_cyclonedx_issue_9277(self):
         """CycloneDX version 1.5 JSON format"""
         with (get_unit_tests_scans_path("cyclonedx") / "issue_9277.json").open(encoding="utf-8") as file: